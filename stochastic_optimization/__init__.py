@@ -0,0 +1,32 @@
+"""Two-stage stochastic refinery supply-chain planning model.
+
+The public functions are resolved on first access so that importing the
+package stays cheap; Pyomo is loaded only when a model is built or solved.
+"""
+
+_EXPORTS = {
+    'build_model': 'model',
+    'solve': 'solver',
+    'extract': 'extraction',
+    'default_data': 'data',
+    'load_data': 'data',
+    'save_data': 'data',
+    'validate': 'data',
+    'content_hash': 'data',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -0,0 +1,87 @@
+"""Merging of scenarios that carry identical data.
+
+Every scenario-indexed parameter except ``PROB`` contributes the entries
+of a scenario, with the scenario label removed, to that scenario's
+signature, normalized by ``data.model_entries`` so that entries the
+model cannot tell apart hash alike.  Scenarios with equal signatures
+have identical second-stage problems.  ``aggregate_scenarios`` keeps
+the first of each group, gives it the summed ``PROB`` and returns the
+label mapping that ``expand_solution`` uses to copy the solution back
+to every original scenario.  Like ``data`` this module does not import Pyomo.
+"""
+import hashlib
+
+from .data import PARAMS, index_tuple, model_entries
+
+
+def _quantize(v, tol):
+    return v if tol <= 0 else round(v / tol)
+
+
+def scenario_signatures(data, tol=0.0):
+    """Return ``{scenario: digest}``; values closer than ``tol`` share a grid cell."""
+    entries = {sc: [] for sc in data['sets']['sc']}
+    for name, index_sets in PARAMS.items():
+        if 'sc' not in index_sets or name == 'PROB':
+            continue
+        pos = index_sets.index('sc')
+        for index, v in model_entries(data, name):
+            sc = index[pos]
+            if sc in entries:
+                entries[sc].append((name, index[:pos] + index[pos + 1:], _quantize(v, tol)))
+    return {
+        sc: hashlib.sha256(repr(sorted(rows, key=repr)).encode('utf-8')).hexdigest()
+        for sc, rows in entries.items()
+    }
+
+
+def aggregate_scenarios(data, tol=0.0):
+    """Return ``(aggregated_data, mapping)`` with duplicate scenarios merged.
+
+    ``mapping`` sends every original scenario to the scenario that
+    represents it.  The input is not modified.
+    """
+    representative = {}
+    mapping = {}
+    for sc, digest in scenario_signatures(data, tol).items():
+        mapping[sc] = representative.setdefault(digest, sc)
+    kept = [sc for sc in data['sets']['sc'] if mapping[sc] == sc]
+
+    params = dict(data['params'])
+    for name, index_sets in PARAMS.items():
+        if 'sc' not in index_sets or name == 'PROB':
+            continue
+        pos = index_sets.index('sc')
+        params[name] = {
+            index: v for index, v in params[name].items()
+            if mapping.get(index_tuple(index)[pos]) == index_tuple(index)[pos]
+        }
+    prob = {}
+    for sc, v in data['params']['PROB'].items():
+        target = mapping.get(sc, sc)
+        prob[target] = prob.get(target, 0) + v
+    params['PROB'] = prob
+    return dict(data, sets=dict(data['sets'], sc=kept), params=params), mapping
+
+
+def expand_solution(solution, mapping, scenario_positions):
+    """Copy each representative's values to the scenarios it stands for.
+
+    ``scenario_positions`` gives, for every variable, the position of the
+    scenario in its index (``None`` for first-stage variables).
+    """
+    members = {}
+    for sc, rep in mapping.items():
+        members.setdefault(rep, []).append(sc)
+    variables = {}
+    for name, values in solution['variables'].items():
+        pos = scenario_positions.get(name)
+        if pos is None:
+            variables[name] = values
+            continue
+        expanded = {}
+        for index, v in values.items():
+            for sc in members.get(index[pos], [index[pos]]):
+                expanded[index[:pos] + (sc,) + index[pos + 1:]] = v
+        variables[name] = expanded
+    return dict(solution, variables=variables)
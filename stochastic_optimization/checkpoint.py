@@ -0,0 +1,179 @@
+"""Checkpoint and resume for long solves.
+
+A checkpoint is a compressed ``.npz`` file holding the current value of
+every variable (one float64 array per ``Var``, NaN where unset, in index
+order), the lazily generated capacity rows as position arrays (see
+``lazy.row_positions``) and a small JSON header with the objective, the
+best bound and the round counter.  Arrays are stored by position, so a
+checkpoint can only be loaded into a model built from the same instance:
+the header records the content hash of the instance (``key``) and the
+size of every variable, and a checkpoint that matches neither is
+rejected.  Once a run ends, its final termination condition is stored as
+``status``; a checkpoint with status ``optimal`` is restored without
+solving again.
+
+``CheckpointingSolver`` wraps a Pyomo solver.  It saves a checkpoint after
+every solve call, which covers each round of the lazy capacity mode, and
+never interrupts the solver on its own.  Only with an ``interval`` does
+it split a MIP solve into time-limited segments: the first runs for
+``interval`` seconds and every further one for twice as long as the one
+before, each resuming from the saved incumbent as a MIP start.  Every
+segment restarts the branch-and-bound tree, and the growing limit makes
+sure that one of them eventually runs long enough to finish.  Segments
+are used only with solvers that accept warm starts.
+"""
+import json
+import os
+import time
+
+import numpy as np
+from pyomo.environ import Var, value
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+
+from .lazy import LAZY_FAMILIES, add_rows, row_positions
+
+# Time-limit option name of each solver plugin, in seconds.
+TIME_LIMIT_OPTIONS = {
+    'glpk': 'tmlim',
+    'cbc': 'sec',
+    'cplex': 'timelimit',
+    'gurobi': 'TimeLimit',
+    'highs': 'time_limit',
+    'appsi_highs': 'time_limit',
+}
+
+
+def _variables(model):
+    return list(model.component_objects(Var, active=True))
+
+
+def save_checkpoint(path, model, result=None, rounds=0, key=None, status=None):
+    """Write the state of ``model`` (and the bounds in ``result``) to ``path``.
+
+    ``key`` identifies the instance and ``status`` marks a finished run.
+    """
+    arrays = {}
+    for var in _variables(model):
+        arrays['var:' + var.name] = np.array(
+            [np.nan if v.value is None else v.value for v in var.values()], dtype=np.float64)
+    for name in LAZY_FAMILIES:
+        if model.component(name) is not None:
+            arrays['rows:' + name] = row_positions(model, name)
+    header = {
+        'saved': time.time(),
+        'rounds': rounds,
+        'key': key,
+        'status': status,
+        'sizes': {var.name: len(var) for var in _variables(model)},
+        'objective': value(model.Obj, exception=False),
+        'lower_bound': None,
+        'upper_bound': None,
+        'termination': None,
+    }
+    if result is not None:
+        header['termination'] = str(result.solver.termination_condition)
+        for bound in ('lower_bound', 'upper_bound'):
+            b = getattr(result.problem, bound, None)
+            header[bound] = None if b is None else float(b)
+    arrays['header'] = np.array(json.dumps(header))
+    tmp = path + '.tmp.npz'
+    np.savez_compressed(tmp, **arrays)
+    os.replace(tmp, path)
+    return header
+
+
+def load_checkpoint(path, model, key=None):
+    """Restore variable values and lazy rows from ``path``; return the header.
+
+    Raises ``ValueError`` if the checkpoint was written for another
+    instance (when ``key`` is given) or for a model with different
+    variables.
+    """
+    with np.load(path, allow_pickle=False) as f:
+        header = json.loads(str(f['header']))
+        if key is not None and header.get('key') != key:
+            raise ValueError(f"checkpoint {path} was written for different instance data")
+        sizes = {var.name: len(var) for var in _variables(model)}
+        if header['sizes'] != sizes:
+            raise ValueError(f"checkpoint {path} does not match this model")
+        for name in LAZY_FAMILIES:
+            entry = 'rows:' + name
+            if entry in f and model.component(name) is not None:
+                add_rows(model, name, f[entry])
+        for var in _variables(model):
+            for v, x in zip(var.values(), f['var:' + var.name]):
+                v.set_value(None if np.isnan(x) else float(x), skip_validation=True)
+    return header
+
+
+def has_incumbent(model):
+    return any(v.value is not None for var in _variables(model) for v in var.values())
+
+
+class CheckpointingSolver:
+    """Solver wrapper that checkpoints to ``path`` and resumes from it."""
+
+    def __init__(self, solver, backend, path, interval=None, key=None):
+        self.solver = solver
+        self.path = path
+        self.interval = interval
+        self.key = key
+        self.time_limit_option = TIME_LIMIT_OPTIONS.get(backend)
+        self.rounds = 0
+        self.resumed = False
+
+    def warm_start_capable(self):
+        return self.solver.warm_start_capable()
+
+    def resume(self, model):
+        # بارگذاری نقطه بازیابی، در صورت وجود، به عنوان جواب شروع
+        if not os.path.exists(self.path):
+            return None
+        header = load_checkpoint(self.path, model, self.key)
+        self.rounds = header['rounds']
+        self.resumed = has_incumbent(model)
+        print(f"Resumed from checkpoint {self.path} (round {self.rounds}, "
+              f"objective {header['objective']}, bounds [{header['lower_bound']}, {header['upper_bound']}])")
+        return header
+
+    @staticmethod
+    def stored_result(header):
+        """Solver results of the finished run recorded in ``header``."""
+        result = SolverResults()
+        result.solver.status = SolverStatus.ok
+        result.solver.termination_condition = TerminationCondition(header['status'])
+        result.problem.lower_bound = header['lower_bound']
+        result.problem.upper_bound = header['upper_bound']
+        return result
+
+    def finish(self, model, result):
+        """Record the final outcome so that a rerun does not solve again."""
+        save_checkpoint(self.path, model, result, self.rounds, self.key,
+                        status=str(result.solver.termination_condition))
+
+    def solve(self, model, tee=True, **options):
+        options = dict(options)
+        load = options.pop('load_solutions', True)
+        if self.resumed and self.warm_start_capable():
+            options['warmstart'] = True
+        segmented = (self.interval and self.time_limit_option is not None
+                     and self.warm_start_capable())
+        limit = self.interval
+        while True:
+            if segmented:
+                self.solver.options[self.time_limit_option] = limit
+            try:
+                result = self.solver.solve(model, tee=tee, load_solutions=False, **options)
+            finally:
+                if segmented:
+                    del self.solver.options[self.time_limit_option]
+            # a segment may end before the first incumbent is found
+            if load and len(result.solution):
+                model.solutions.load_from(result)
+            self.rounds += 1
+            save_checkpoint(self.path, model, result, self.rounds, self.key)
+            if not segmented or result.solver.termination_condition != TerminationCondition.maxTimeLimit:
+                return result
+            if has_incumbent(model):
+                options['warmstart'] = True
+            limit *= 2
@@ -0,0 +1,134 @@
+"""Command-line entry point.
+
+Only the standard-library modules ``data`` and ``solution`` are imported
+up front, so ``--help``, ``--validate-only`` and cache hits never load
+Pyomo or NumPy.
+"""
+import argparse
+import json
+import sys
+
+from .data import default_data, load_data, save_data, validate
+from .solution import ResultCache, print_solution, result_key, to_json
+
+
+def tree_spec(text):
+    if text == 'auto':
+        return text
+    try:
+        return [int(b) for b in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected 'auto' or comma-separated branching factors, got {text!r}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='stochopt',
+        description='Solve the two-stage stochastic refinery supply-chain planning model.',
+    )
+    parser.add_argument('data', nargs='?', help='instance JSON file (default: the built-in reference instance)')
+    parser.add_argument('--backend', default='glpk', help='Pyomo solver name (default: %(default)s)')
+    parser.add_argument('--lazy-capacity', action='store_true',
+                        help='generate capacity and inventory constraints lazily')
+    parser.add_argument('--lazy-max-rounds', type=int, metavar='N',
+                        help='stop lazy generation after N rounds; the result is then not optimal')
+    parser.add_argument('--eliminate-binaries', action='store_true',
+                        help='drop the surplus/backlog binaries when the penalties make them redundant')
+    parser.add_argument('--aggregate-scenarios', action='store_true',
+                        help='merge scenarios with identical data, summing their probabilities')
+    parser.add_argument('--scenario-tol', type=float, default=0.0,
+                        help='treat scenario data within this tolerance as identical (default: exact)')
+    parser.add_argument('--scenario-tree', type=tree_spec, metavar='auto|B1,B2,...',
+                        help='share recourse decisions along a scenario tree inferred from the data (auto) '
+                             'or with the given branching per period')
+    parser.add_argument('--scaling', choices=['geometric', 'equilibration'],
+                        help='solve a row/column-scaled copy of the model and unscale the solution')
+    parser.add_argument('--checkpoint', metavar='FILE',
+                        help='resume from FILE if it exists and save progress to it')
+    parser.add_argument('--checkpoint-interval', type=float, metavar='SECONDS',
+                        help='save the incumbent every SECONDS (warm-start capable solvers only)')
+    parser.add_argument('--solution-store', metavar='DIR',
+                        help='warm-start from the last plan of the same network stored in DIR')
+    parser.add_argument('--export', metavar='FILE',
+                        help='write the model to FILE (.mps, .lp, optionally .gz, or .npz) and exit')
+    parser.add_argument('--validate-only', action='store_true', help='check the instance data and exit')
+    parser.add_argument('--cache-dir', help='reuse and store results keyed by the instance content hash')
+    parser.add_argument('--output', help='write the solution as JSON to this file')
+    parser.add_argument('--write-data', metavar='FILE', help='write the instance as JSON to FILE and exit')
+    parser.add_argument('--quiet', action='store_true', help='hide solver output and variable values')
+    return parser.parse_args(argv)
+
+
+def run(args):
+    data = load_data(args.data) if args.data else default_data()
+    try:
+        validate(data)
+        if args.aggregate_scenarios and args.scenario_tree not in (None, 'auto'):
+            raise ValueError("--scenario-tree branching factors refer to the original scenarios; "
+                             "use --scenario-tree auto with --aggregate-scenarios")
+        if args.scaling and (args.lazy_capacity or args.checkpoint):
+            raise ValueError("--scaling cannot be combined with --lazy-capacity or --checkpoint")
+        if args.export:
+            from .export import export_format
+            export_format(args.export)
+            if args.lazy_capacity or args.scaling:
+                raise ValueError("--export writes the complete unscaled model; "
+                                 "it cannot be combined with --lazy-capacity or --scaling")
+        if args.scenario_tree is not None:
+            from .tree import ScenarioTree
+            ScenarioTree.from_spec(data, args.scenario_tree)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if args.write_data:
+        save_data(data, args.write_data)
+        return 0
+    if args.validate_only:
+        print("Instance data is valid.")
+        return 0
+
+    if args.export:
+        from .export import export_model
+        from .solver import build_instance
+        _, _, model, _ = build_instance(data, eliminate_binaries=args.eliminate_binaries,
+                                        aggregate=args.aggregate_scenarios, scenario_tol=args.scenario_tol,
+                                        scenario_tree=args.scenario_tree)
+        names = export_model(model, args.export)
+        print(f"Model written to {args.export} (names in {names}).")
+        return 0
+
+    cache = ResultCache(args.cache_dir) if args.cache_dir else None
+    key = result_key(data, args.backend, lazy_capacity=args.lazy_capacity, scaling=args.scaling,
+                     eliminate_binaries=args.eliminate_binaries, aggregate=args.aggregate_scenarios,
+                     scenario_tol=args.scenario_tol, scenario_tree=args.scenario_tree)
+    solution = cache.get(key) if cache else None
+    if solution is not None:
+        print(f"Loaded cached result {key[:12]} (status: {solution['status']}).")
+    else:
+        from .solver import solve_instance
+
+        try:
+            solution = solve_instance(data, args.backend, lazy_capacity=args.lazy_capacity,
+                                      lazy_max_rounds=args.lazy_max_rounds, tee=not args.quiet,
+                                      solution_store=args.solution_store, checkpoint=args.checkpoint,
+                                      checkpoint_interval=args.checkpoint_interval, scaling=args.scaling,
+                                      eliminate_binaries=args.eliminate_binaries,
+                                      aggregate=args.aggregate_scenarios, scenario_tol=args.scenario_tol,
+                                      scenario_tree=args.scenario_tree)
+        except ValueError as e:
+            # e.g. a checkpoint written for other data
+            print(e, file=sys.stderr)
+            return 2
+        if cache and solution['status'] == 'optimal':
+            cache.put(key, solution)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(to_json(solution), f)
+    if not args.quiet:
+        print_solution(solution)
+    return 0
+
+
+def main(argv=None):
+    sys.exit(run(parse_args(argv)))
@@ -0,0 +1,262 @@
+"""Instance data for the planning model.
+
+An instance is a plain dict with two entries: ``sets`` maps each set name
+to its ordered list of labels, and ``params`` maps each parameter name to
+either a scalar or a dict keyed by index tuples (bare labels for
+single-index parameters), exactly as the values are passed to
+``Param(initialize=...)``.  This module depends only on the
+standard library so that loading, validating and hashing instances does
+not pull in Pyomo.
+
+On disk an instance is JSON; indexed parameters are written as lists of
+rows ``[index..., value]`` because JSON objects cannot have tuple keys.
+"""
+import hashlib
+import json
+from itertools import product
+
+SETS = ('m', 'p', 'tp', 'tr', 'sc', 'b', 'c', 'oc', 'of', 'r', 'te', 'n', 'np')
+
+# Index sets of every parameter, in the order used by the model.
+PARAMS = {
+    'BigM': (),
+    'TAXC': (),
+    'BCK': ('p', 'tp'),
+    'CAPL': ('r', 'm', 'tp'),
+    'CAPU': ('r', 'm', 'tp'),
+    'DEM': ('p', 'c', 'sc', 'tp'),
+    'DEM_oc': ('p', 'oc', 'sc', 'tp'),
+    'DIS': ('n', 'np'),
+    'DSR': ('r', 'm'),
+    'EPPU': ('p', 'tp'),
+    'EPUP': ('p', 'te', 'tp'),
+    'IVU': ('m', 'r', 'tp'),
+    'IVU_b': ('p', 'b', 'tp'),
+    'IVU_te': ('p', 'te', 'tp'),
+    'IVUP': ('m', 'r', 'tp'),
+    'IVUP_b': ('p', 'b', 'tp'),
+    'IVUP_te': ('p', 'te', 'tp'),
+    'MPU': ('m', 'tp'),
+    'MUP': ('m', 'te', 'tp'),
+    'MUP_of': ('m', 'of', 'tp'),
+    'MTUP': ('m', 'n', 'np', 'tr', 'tp'),
+    'PTUP': ('p', 'n', 'np', 'tr', 'tp'),
+    'PUP': ('p', 'te', 'sc', 'tp'),
+    'PUP_b': ('p', 'b', 'sc', 'tp'),
+    'QBU': ('p', 'c', 'tp'),
+    'QBU_oc': ('p', 'oc', 'tp'),
+    'QSU': ('p', 'c', 'tp'),
+    'QSU_oc': ('p', 'oc', 'tp'),
+    'ROUP': ('r', 'm', 'tp'),
+    'SC_m': ('m', 'tp'),
+    'SC_p': ('p', 'tp'),
+    'SUR': ('p', 'tp'),
+    'TCAU': ('n', 'np', 'tr', 'tp'),
+    'YDR': ('r', 'm', 'p'),
+    'YDR_tp': ('r', 'm', 'tp'),
+    'CCOEF': ('tr',),
+    'EC': ('r',),
+    'PROB': ('sc',),
+}
+
+# Parameters whose missing entries are zero: arcs, transport tools, refinery
+# units and customers that are absent from the instance or from a scenario.
+# Every other indexed parameter must cover the product of its index sets.
+ZERO_DEFAULT = frozenset({
+    'CAPL', 'CAPU', 'DEM', 'DEM_oc', 'DSR', 'IVU', 'IVUP', 'MTUP', 'PTUP',
+    'PUP', 'PUP_b', 'ROUP', 'TCAU', 'YDR', 'YDR_tp',
+})
+
+_NODES = ['o_oc1', 'o_of', 'o_te', 'o_r1', 'o_b1', 'o_c1']
+_PAIRED_NODES = ['i_oc1', 'i_of', 'i_te', 'i_r1', 'i_b1', 'i_c1']
+# Arcs of the network that carry a distance, price or capacity.
+_ARCS = [('o_of', 'i_r1'), ('o_te', 'i_oc1'), ('o_te', 'i_b1'), ('o_r1', 'i_te'), ('o_r1', 'i_b1'), ('o_b1', 'i_c1')]
+
+
+def _arc_values(value, prefix=(), suffix=()):
+    # Dense n x np table with ``value`` on the network arcs and 0 elsewhere.
+    return {
+        prefix + (n, np) + suffix: (value if (n, np) in _ARCS else 0)
+        for n in _NODES for np in _PAIRED_NODES
+    }
+
+
+def default_data():
+    """Return the reference instance shipped with the model."""
+    scenarios = ['SC1', 'SC2', 'SC3', 'SC4', 'SC5', 'SC6', 'SC7', 'SC8', 'SC9']
+    demand = dict(zip(scenarios, [24, 30, 36] * 3))
+    price = dict(zip(scenarios, [936] * 3 + [1170] * 3 + [1404] * 3))
+    return {
+        'sets': {
+            'm': ['m1'],
+            'p': ['p1'],
+            'tp': ['tp1'],
+            'tr': ['tr1', 'tr2', 'tr3', 'tr4'],
+            'sc': [
+                'SC1', 'SC2', 'SC3', 'SC4', 'SC5', 'SC6', 'SC7', 'SC8', 'SC9',
+                'SC_oc1', 'SC_oc2', 'SC_of', 'SC_te', 'SC_r1', 'SC_r2', 'SC_r3',
+                'SC_b1', 'SC_b2', 'SC_b3', 'SC_c1', 'SC_c2', 'SC_c3', 'SC_c4', 'SC_c5',
+            ],
+            'b': ['b1'],
+            'c': ['c1'],
+            'oc': ['oc1'],
+            'of': ['of1'],
+            'r': ['r1', 'r2', 'r3'],
+            'te': ['te1'],
+            'n': list(_NODES),
+            'np': list(_PAIRED_NODES),
+        },
+        'params': {
+            'BigM': 1e11,
+            'TAXC': 10,
+            'BCK': {('p1', 'tp1'): 50},
+            'CAPL': {('r1', 'm1', 'tp1'): 100},
+            'CAPU': {('r1', 'm1', 'tp1'): 400},
+            'DEM': {('p1', 'c1', sc, 'tp1'): v for sc, v in demand.items()},
+            'DEM_oc': {('p1', 'oc1', sc, 'tp1'): v for sc, v in demand.items()},
+            'DIS': _arc_values(10),
+            'DSR': {('r1', 'm1'): 0.5},
+            'EPPU': {('p1', 'tp1'): 300},
+            'EPUP': {('p1', 'te1', 'tp1'): 50},
+            'IVU': {('m1', 'r1', 'tp1'): 100},
+            'IVU_b': {('p1', 'b1', 'tp1'): 100},
+            'IVU_te': {('p1', 'te1', 'tp1'): 100},
+            'IVUP': {('m1', 'r1', 'tp1'): 100},
+            'IVUP_b': {('p1', 'b1', 'tp1'): 100},
+            'IVUP_te': {('p1', 'te1', 'tp1'): 100},
+            'MPU': {('m1', 'tp1'): 150},
+            'MUP': {('m1', 'te1', 'tp1'): 800},
+            'MUP_of': {('m1', 'of1', 'tp1'): 800},
+            'MTUP': _arc_values(85, ('m1',), ('tr1', 'tp1')),
+            'PTUP': _arc_values(10, ('p1',), ('tr1', 'tp1')),
+            'PUP': {('p1', 'te1', sc, 'tp1'): v for sc, v in price.items()},
+            'PUP_b': {('p1', 'b1', sc, 'tp1'): v for sc, v in price.items()},
+            'QBU': {('p1', 'c1', 'tp1'): 500},
+            'QBU_oc': {('p1', 'oc1', 'tp1'): 500},
+            'QSU': {('p1', 'c1', 'tp1'): 500},
+            'QSU_oc': {('p1', 'oc1', 'tp1'): 500},
+            'ROUP': {('r1', 'm1', 'tp1'): 50},
+            'SC_m': {('m1', 'tp1'): 50},
+            'SC_p': {('p1', 'tp1'): 50},
+            'SUR': {('p1', 'tp1'): 30},
+            'TCAU': _arc_values(1000, (), ('tr1', 'tp1')),
+            'YDR': {('r1', 'm1', 'p1'): 1},
+            'YDR_tp': {('r1', 'm1', 'tp1'): 1},
+            'CCOEF': {'tr1': -5304, 'tr2': -5330, 'tr3': -5928, 'tr4': -5980},
+            'EC': {'r1': 79, 'r2': 492, 'r3': 329},
+            'PROB': {
+                'SC_oc1': 0, 'SC_oc2': 0, 'SC_of': 1, 'SC_te': 0,
+                'SC_r1': 0, 'SC_r2': 1, 'SC_r3': 1,
+                'SC_b1': 0, 'SC_b2': 0, 'SC_b3': 1,
+                'SC_c1': 1, 'SC_c2': 1, 'SC_c3': 1, 'SC_c4': 1, 'SC_c5': 0,
+                # No probability is given for SC1..SC9 in the DEM/DEM_oc sheet; assumed to be 1.
+                'SC1': 1, 'SC2': 1, 'SC3': 1, 'SC4': 1, 'SC5': 1,
+                'SC6': 1, 'SC7': 1, 'SC8': 1, 'SC9': 1,
+            },
+        },
+    }
+
+
+def index_tuple(index):
+    # Single-index parameters are keyed by the bare label, as in Pyomo.
+    return index if isinstance(index, tuple) else (index,)
+
+
+def model_entries(data, name):
+    """Yield ``(index, value)`` of parameter ``name`` as the model sees them.
+
+    Values are floats (``24`` and ``24.0`` are the same entry) and zero
+    entries of ``ZERO_DEFAULT`` parameters, which equal a missing entry,
+    are left out.
+    """
+    drop_zero = name in ZERO_DEFAULT
+    for index, v in data['params'][name].items():
+        v = float(v) + 0.0  # -0.0 -> 0.0
+        if v or not drop_zero:
+            yield index_tuple(index), v
+
+
+def to_json(data):
+    params = {}
+    for name, values in data['params'].items():
+        if PARAMS[name]:
+            params[name] = [list(index_tuple(index)) + [v] for index, v in values.items()]
+        else:
+            params[name] = values
+    return {'sets': {k: list(v) for k, v in data['sets'].items()}, 'params': params}
+
+
+def from_json(obj):
+    params = {}
+    for name, values in obj['params'].items():
+        if PARAMS.get(name) and len(PARAMS[name]) == 1:
+            params[name] = {row[0]: row[1] for row in values}
+        elif PARAMS.get(name):
+            params[name] = {tuple(row[:-1]): row[-1] for row in values}
+        else:
+            params[name] = values
+    return {'sets': {k: list(v) for k, v in obj['sets'].items()}, 'params': params}
+
+
+def load_data(path):
+    with open(path, encoding='utf-8') as f:
+        return from_json(json.load(f))
+
+
+def save_data(data, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(to_json(data), f, ensure_ascii=False, indent=1)
+
+
+def validate(data):
+    """Check an instance against the parameter schema.
+
+    Raises ``ValueError`` listing every problem found: missing or unknown
+    sets and parameters, index tuples of the wrong length, labels that are
+    not members of their set, non-numeric values and index tuples without
+    a value in parameters outside ``ZERO_DEFAULT``.
+    """
+    errors = []
+    sets = data.get('sets', {})
+    params = data.get('params', {})
+    members = {name: set(sets.get(name, ())) for name in SETS}
+    errors += [f"missing set '{name}'" for name in SETS if name not in sets]
+    errors += [f"unknown set '{name}'" for name in sets if name not in SETS]
+    errors += [f"set '{name}' has duplicate labels" for name in SETS
+               if name in sets and len(sets[name]) != len(members[name])]
+    errors += [f"missing parameter '{name}'" for name in PARAMS if name not in params]
+    for name, values in params.items():
+        if name not in PARAMS:
+            errors.append(f"unknown parameter '{name}'")
+            continue
+        index_sets = PARAMS[name]
+        if not index_sets:
+            values = {(): values}
+        elif not isinstance(values, dict):
+            errors.append(f"parameter '{name}' must be indexed by {index_sets}")
+            continue
+        for index, v in values.items():
+            index = index_tuple(index)
+            if len(index) != len(index_sets):
+                errors.append(f"{name}{list(index)}: expected {len(index_sets)} indices")
+            else:
+                errors += [f"{name}{list(index)}: '{label}' is not in set '{s}'"
+                           for label, s in zip(index, index_sets) if label not in members[s]]
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                errors.append(f"{name}{list(index)}: value {v!r} is not a number")
+        if index_sets and name not in ZERO_DEFAULT and all(s in sets for s in index_sets):
+            defined = {index_tuple(index) for index in values}
+            missing = [index for index in product(*(sets[s] for s in index_sets)) if index not in defined]
+            if missing:
+                errors.append(f"{name}: no value for {len(missing)} of its indices, e.g. "
+                              + ', '.join(str(list(index)) for index in missing[:3]))
+    if errors:
+        raise ValueError('invalid instance data:\n  ' + '\n  '.join(errors))
+
+
+def content_hash(data, **options):
+    """Stable SHA-256 of an instance plus any solve options that change the result."""
+    obj = to_json(data)
+    obj['params'] = {k: sorted(v, key=repr) if PARAMS[k] else v for k, v in obj['params'].items()}
+    payload = json.dumps({'data': obj, 'options': options}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
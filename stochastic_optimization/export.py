@@ -0,0 +1,305 @@
+"""Compact export of the model to free MPS, CPLEX LP or NumPy CSR files.
+
+Rows and columns are written as ``R<i>`` and ``C<j>``.  The symbolic
+Pyomo names go to a separate tab-separated name map (``<file>.names``,
+one ``R<i>\\t<name>`` or ``C<j>\\t<name>`` line each), so the model file
+itself stays small over the dense index sets.  The LP writer streams:
+it writes every row, and its name map line, straight from the
+constraint's ``generate_standard_repn``, so beyond one row it only keeps
+the column number of every variable.  MPS is written by column, so the
+MPS and NPZ writers first collect the whole ``matrix.LinearMatrix``; its
+memory grows with the number of nonzeros, and MPS needs a second,
+column-ordered copy.  A ``.gz`` suffix compresses the output.
+
+A nonzero objective constant becomes an extra column fixed to 1 (the last
+column in MPS, ``C0`` in LP; ``ONE_VAR_CONSTANT`` in the name map),
+because neither format has a portable way to state it.  Free rows are
+written as ``N`` rows in MPS and left out of LP files, which cannot
+express them.  LP files split a ranged row into ``R<i>_lo`` and
+``R<i>_hi``, and the name map lists both.
+
+The ``.npz`` format stores the CSR arrays (``indptr``, ``indices``,
+``data``) with ``row_lower``/``row_upper``, ``col_lower``/``col_upper``,
+``integer``, the objective vector ``c``, ``objective_constant`` and
+``maximize``; infinite bounds are stored as ``inf``.
+"""
+import gzip
+from contextlib import nullcontext
+from functools import lru_cache
+from math import isinf
+
+import numpy as np
+from pyomo.core.base.component_namer import index_repr, name_repr
+from pyomo.environ import Constraint, Var, maximize
+
+from .matrix import LinearMatrix, linear_objective, linear_row
+
+FORMATS = ('mps', 'lp', 'npz')
+_TERMS_PER_LINE = 8
+
+
+def export_format(path):
+    name = path[:-3] if path.endswith('.gz') else path
+    fmt = name.rsplit('.', 1)[-1].lower()
+    if fmt not in FORMATS or (fmt == 'npz' and name != path):
+        raise ValueError(f"cannot infer export format from {path!r}; use .mps, .lp (optionally .gz) or .npz")
+    return fmt
+
+
+def _open(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', encoding='utf-8', buffering=1 << 20)
+
+
+@lru_cache(maxsize=1 << 16)
+def _num(x):
+    # coefficients repeat a lot; equal values (1, 1.0, -0.0, 0) format alike
+    return repr(float(x)) if x != int(x) or abs(x) >= 1e15 else str(int(x))
+
+
+def _constant_column(matrix):
+    # index of the column that carries the objective constant, or None
+    return len(matrix.variables) if matrix.objective_constant != 0 else None
+
+
+class _Labels(dict):
+    """Pyomo name labels of index members; string labels are formatted once."""
+
+    def __missing__(self, x):
+        label = name_repr(x)
+        if x.__class__ is str:
+            # other types are not cached: 1, 1.0 and True are equal keys
+            self[x] = label
+        return label
+
+
+def _named_items(model, ctype, numbers=None, active=None):
+    """Yield ``(number, name, data)`` for the data objects of ``ctype``.
+
+    ``numbers`` maps ``id(data)`` to a row or column number and selects
+    the data to yield; without it every (active) data object is yielded,
+    numbered in model order.  Names match ``data.name`` but are built from
+    the component name and the index, which is much cheaper over large
+    index sets.  References are skipped, so every data object appears once.
+    """
+    labels = _Labels()
+    count = 0
+    for component in model.component_objects(ctype, active=active, descend_into=True):
+        if component.is_reference():
+            continue
+        base = component.name
+        indexed = component.is_indexed()
+        for index, data in component.items():
+            if numbers is not None:
+                number = numbers.get(id(data))
+                if number is None:
+                    continue
+            elif active and not data.active:
+                continue
+            else:
+                number, count = count, count + 1
+            if not indexed:
+                yield number, base, data
+            elif index.__class__ is tuple and len(index) > 1:
+                yield number, base + '[' + ','.join(map(labels.__getitem__, index)) + ']', data
+            else:
+                yield number, base + index_repr(index), data
+
+
+def write_name_map(matrix, path):
+    rows = {id(con): i for i, con in enumerate(matrix.constraints)}
+    with _open(path) as f:
+        for i, name, _ in _named_items(matrix.model, Constraint, rows, active=True):
+            f.write(f'R{i}\t{name}\n')
+        _write_column_names(f, matrix.model, {id(var): j for j, var in enumerate(matrix.variables)})
+        if _constant_column(matrix) is not None:
+            f.write(f'C{_constant_column(matrix)}\tONE_VAR_CONSTANT\n')
+
+
+def _write_column_names(f, model, columns):
+    for j, name, _ in _named_items(model, Var, columns):
+        f.write(f'C{j}\t{name}\n')
+
+
+def write_mps(matrix, path):
+    lower, upper = matrix.row_lower, matrix.row_upper
+    with _open(path) as f:
+        f.write('NAME model\n')
+        if matrix.maximize:
+            f.write('OBJSENSE\n    MAX\n')
+        f.write('ROWS\n N obj\n')
+        for i, (lo, hi) in enumerate(zip(lower, upper)):
+            if lo == hi:
+                kind = 'E'
+            elif np.isinf(lo):
+                kind = 'N' if np.isinf(hi) else 'L'
+            else:  # ranged rows are G rows with a RANGES entry
+                kind = 'G'
+            f.write(f' {kind} R{i}\n')
+
+        f.write('COLUMNS\n')
+        indptr, rows, data = matrix.csc()
+        in_integer_block = False
+        for j in range(len(matrix.variables)):
+            if matrix.integer[j] != in_integer_block:
+                in_integer_block = bool(matrix.integer[j])
+                f.write(f"    MARKER 'MARKER' '{'INTORG' if in_integer_block else 'INTEND'}'\n")
+            if matrix.c[j] != 0:
+                f.write(f'    C{j} obj {_num(matrix.c[j])}\n')
+            start, end = indptr[j], indptr[j + 1]
+            f.writelines(f'    C{j} R{i} {_num(a)}\n' for i, a in zip(rows[start:end], data[start:end]))
+            if start == end and matrix.c[j] == 0:
+                f.write(f'    C{j} obj 0\n')
+        if in_integer_block:
+            f.write("    MARKER 'MARKER' 'INTEND'\n")
+        constant = _constant_column(matrix)
+        if constant is not None:
+            f.write(f'    C{constant} obj {_num(matrix.objective_constant)}\n')
+
+        f.write('RHS\n')
+        for i, (lo, hi) in enumerate(zip(lower, upper)):
+            rhs = hi if np.isinf(lo) else lo
+            if rhs != 0 and not np.isinf(rhs):
+                f.write(f'    rhs R{i} {_num(rhs)}\n')
+
+        ranged = np.flatnonzero(np.isfinite(lower) & np.isfinite(upper) & (lower != upper))
+        if len(ranged):
+            f.write('RANGES\n')
+            f.writelines(f'    rng R{i} {_num(upper[i] - lower[i])}\n' for i in ranged)
+
+        f.write('BOUNDS\n')
+        for j, (lo, hi) in enumerate(zip(matrix.col_lower, matrix.col_upper)):
+            if lo == hi:
+                f.write(f' FX bnd C{j} {_num(lo)}\n')
+                continue
+            if np.isinf(lo):
+                f.write(f' MI bnd C{j}\n')
+            elif lo != 0:
+                f.write(f' LO bnd C{j} {_num(lo)}\n')
+            if not np.isinf(hi):
+                f.write(f' UP bnd C{j} {_num(hi)}\n')
+            elif matrix.integer[j]:
+                f.write(f' PL bnd C{j}\n')
+        if constant is not None:
+            f.write(f' FX bnd C{constant} 1\n')
+        f.write('ENDATA\n')
+
+
+def _terms(pairs):
+    """LP text of the linear terms ``pairs``, wrapped every few terms."""
+    if not pairs:
+        return ' 0 C0'
+    text = [f" {'+' if a >= 0 else '-'} {_num(abs(a))} C{j}" for j, a in pairs]
+    for k in range(_TERMS_PER_LINE, len(text), _TERMS_PER_LINE):
+        text[k] = '\n   ' + text[k]
+    return ''.join(text)
+
+
+def _lp_rows(lower, upper):
+    """``(suffix, sense, rhs)`` of the LP rows for ``lower <= body <= upper``."""
+    if lower == upper:
+        return [('', '=', lower)]
+    if isinf(lower) and isinf(upper):
+        return []  # free rows do not constrain anything
+    if isinf(lower):
+        return [('', '<=', upper)]
+    if isinf(upper):
+        return [('', '>=', lower)]
+    return [('_lo', '>=', lower), ('_hi', '<=', upper)]  # ranged rows become two rows
+
+
+def write_lp(model, path, names_path=None):
+    """Write ``model`` to ``path`` one constraint at a time.
+
+    Unlike the other writers this one does not build a ``LinearMatrix``:
+    each row is written, together with its name map line, as soon as its
+    coefficients are known, so only the column numbers of the variables
+    are kept.  The objective constant, if any, is column ``C0``.
+    """
+    columns, variables = {}, []
+
+    def col(var):
+        j = columns.get(id(var))
+        if j is None:
+            j = columns[id(var)] = len(variables)
+            variables.append(var)
+        return j
+
+    objective, objective_terms, constant = linear_objective(model)
+    if constant != 0:
+        variables.append(None)
+    with _open(path) as f, (_open(names_path) if names_path else nullcontext()) as names:
+        f.write('maximize\n' if objective.sense == maximize else 'minimize\n')
+        terms = [(col(var), coef) for var, coef in objective_terms if coef != 0]
+        if constant != 0:
+            terms.append((0, constant))
+        f.write(f' obj:{_terms(terms)}\nsubject to\n')
+        for i, name, con in _named_items(model, Constraint, active=True):
+            terms, lower, upper = linear_row(con, col)
+            text = None
+            for suffix, sense, rhs in _lp_rows(lower, upper):
+                text = text or _terms(terms)
+                f.write(f' R{i}{suffix}:{text} {sense} {_num(rhs)}\n')
+                if names is not None:
+                    names.write(f'R{i}{suffix}\t{name}\n')
+
+        f.write('bounds\n')
+        for j, var in enumerate(variables):
+            if var is None:
+                f.write(f' C{j} = 1\n')
+                continue
+            lo, hi = var.lb, var.ub
+            if lo is not None and lo == hi:
+                f.write(f' C{j} = {_num(lo)}\n')
+            elif lo is None and hi is None:
+                f.write(f' C{j} free\n')
+            else:
+                lo_text = '-inf' if lo is None else _num(lo)
+                hi_text = '+inf' if hi is None else _num(hi)
+                f.write(f' {lo_text} <= C{j} <= {hi_text}\n')
+
+        integers = [j for j, var in enumerate(variables) if var is not None and var.is_integer()]
+        if integers:
+            f.write('general\n')
+            for k in range(0, len(integers), _TERMS_PER_LINE):
+                f.write(' ' + ' '.join(f'C{j}' for j in integers[k:k + _TERMS_PER_LINE]) + '\n')
+        f.write('end\n')
+
+        if names is not None:
+            _write_column_names(names, model, columns)
+            if constant != 0:
+                names.write('C0\tONE_VAR_CONSTANT\n')
+
+
+def write_npz(matrix, path):
+    with open(path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            indptr=matrix.indptr, indices=matrix.indices, data=matrix.data,
+            row_lower=matrix.row_lower, row_upper=matrix.row_upper,
+            col_lower=matrix.col_lower, col_upper=matrix.col_upper,
+            integer=matrix.integer, c=matrix.c,
+            objective_constant=matrix.objective_constant, maximize=matrix.maximize,
+        )
+
+
+WRITERS = {'mps': write_mps, 'npz': write_npz}
+
+
+def export_model(model, path, names=True):
+    """Write ``model`` to ``path`` in the format given by its extension.
+
+    With ``names`` the name map is written next to it as ``<path>.names``.
+    Returns the path of the name map, or None.
+    """
+    fmt = export_format(path)
+    names_path = path + '.names' if names else None
+    if fmt == 'lp':
+        write_lp(model, path, names_path)
+        return names_path
+    matrix = LinearMatrix(model)
+    WRITERS[fmt](matrix, path)
+    if names_path is not None:
+        write_name_map(matrix, names_path)
+    return names_path
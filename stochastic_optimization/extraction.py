@@ -0,0 +1,48 @@
+"""Reading the solution back out of a solved model."""
+from pyomo.environ import Var, value
+
+
+def _variables(model):
+    # node-indexed storage of a scenario tree is reported through its (sc, tp) references
+    node = model.component('node')
+    for var in model.component_objects(Var, active=True):
+        if node is None or not var.is_indexed() or var.is_reference() \
+                or all(s is not node for s in var.index_set().subsets()):
+            yield var
+
+
+def _values(model, var):
+    tree = getattr(model, 'tree', None)
+    if tree is None or not var.is_reference():
+        return {index: var[index].value for index in var}
+    # the scenario view of a tree covers only some scenarios; report all of them
+    values = {}
+    for index, v in model.component(var.name + '_node').items():
+        node = index[-1]
+        for sc in tree.members[node]:
+            values[index[:-1] + (sc, tree.period_of[node])] = v.value
+    return values
+
+
+def extract(model):
+    """Return the primal solution as ``{var_name: {index: value}}``."""
+    return {var.name: _values(model, var) for var in _variables(model)}
+
+
+def objective_value(model):
+    try:
+        return value(model.Obj)
+    except ValueError:
+        return None
+
+
+def scenario_positions(model):
+    """Return ``{var_name: position of model.sc in its index, or None}``."""
+    positions = {}
+    for var in _variables(model):
+        if var.is_reference():  # scenario-tree view indexed by (..., sc, tp)
+            positions[var.name] = len(next(iter(var))) - 2
+            continue
+        subsets = list(var.index_set().subsets()) if var.is_indexed() else []
+        positions[var.name] = next((i for i, s in enumerate(subsets) if s is model.sc), None)
+    return positions
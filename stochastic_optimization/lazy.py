@@ -0,0 +1,138 @@
+"""Lazy generation of the capacity and inventory constraint families.
+
+A model built with ``build_model(data, lazy_capacity=True)`` starts without
+the rows of ``LAZY_FAMILIES``.  After each solve the candidate solution is
+checked against those families with a vectorized NumPy pass and only the
+violated rows are added before re-solving.
+"""
+import numpy as np
+from pyomo.environ import value
+from pyomo.opt import SolverStatus, TerminationCondition
+
+from .model import (
+    inventory_capacity_material_rule,
+    inventory_capacity_product_distribution_rule,
+    inventory_capacity_product_terminal_rule,
+    procurement_capacity_material_rule,
+    transport_capacity_rule,
+)
+
+# Constraint name -> (rule, names of its index sets)
+LAZY_FAMILIES = {
+    'transport_capacity': (transport_capacity_rule, ('n', 'np', 'tr', 'tp')),
+    'ProcurementCapacityMaterial': (procurement_capacity_material_rule, ('m', 'te', 'of', 'tp')),
+    'InventoryCapacityMaterial': (inventory_capacity_material_rule, ('m', 'r', 'sc', 'tp')),
+    'InventoryCapacityProductTerminal': (inventory_capacity_product_terminal_rule, ('p', 'te', 'sc', 'tp')),
+    'InventoryCapacityProductDistribution': (inventory_capacity_product_distribution_rule, ('p', 'b', 'sc', 'tp')),
+}
+
+
+def var_array(var, *sets):
+    # مقادیر متغیر به صورت آرایه NumPy؛ متغیرهای بدون مقدار صفر در نظر گرفته می‌شوند
+    # نمای درخت سناریو فقط سناریوی نماینده هر گره را دارد
+    tree = getattr(var.model(), 'tree', None) if var.is_reference() else None
+    values = np.zeros([len(s) for s in sets])
+    for pos in np.ndindex(values.shape):
+        index = tuple(s.at(i + 1) for s, i in zip(sets, pos))
+        if tree is not None:
+            index = index[:-2] + (tree.representative(*index[-2:]), index[-1])
+        v = var[index].value
+        values[pos] = 0 if v is None else v
+    return values
+
+
+def param_array(param, *sets):
+    values = np.zeros([len(s) for s in sets])
+    for pos in np.ndindex(values.shape):
+        values[pos] = value(param[tuple(s.at(i + 1) for s, i in zip(sets, pos))])
+    return values
+
+
+def capacity_violations(model, tol=1e-6):
+    # برای هر خانواده قید: ماتریس بولی نقض روی مجموعه‌های اندیس آن
+    m, p, n, np_, tr, tp = model.m, model.p, model.n, model.np, model.tr, model.tp
+    sc, r, te, of, b = model.sc, model.r, model.te, model.of, model.b
+
+    transport_lhs = var_array(model.mf, m, n, np_, tr, tp).sum(axis=0) + var_array(model.pf, p, n, np_, tr, tp).sum(axis=0)
+    transport = transport_lhs - param_array(model.TCAU, n, np_, tr, tp) > tol
+
+    procured_te = var_array(model.qmp, m, te, r, tp).sum(axis=(1, 2))
+    procured_of = var_array(model.qmp_of, m, of, r, tp).sum(axis=2)
+    procurement_lhs = procured_te[:, None, None, :] + procured_of[:, None, :, :]
+    procurement = procurement_lhs - param_array(model.MPU, m, tp)[:, None, None, :] > tol
+
+    inventory_material = var_array(model.qmsto, m, r, sc, tp) - param_array(model.IVU, m, r, tp)[:, :, None, :] > tol
+    inventory_terminal = var_array(model.qpsto, p, te, sc, tp) - param_array(model.IVU_te, p, te, tp)[:, :, None, :] > tol
+    inventory_distribution = var_array(model.qpsto_b, p, b, sc, tp) - param_array(model.IVU_b, p, b, tp)[:, :, None, :] > tol
+
+    return {
+        'transport_capacity': transport,
+        'ProcurementCapacityMaterial': np.broadcast_to(procurement, (len(m), len(te), len(of), len(tp))),
+        'InventoryCapacityMaterial': inventory_material,
+        'InventoryCapacityProductTerminal': inventory_terminal,
+        'InventoryCapacityProductDistribution': inventory_distribution,
+    }
+
+
+def add_rows(model, name, positions):
+    # positions: آرایه (k, d) از موقعیت‌های صفرمبنا در مجموعه‌های اندیس خانواده
+    rule, set_names = LAZY_FAMILIES[name]
+    sets = [model.component(s) for s in set_names]
+    component = model.component(name)
+    tree = getattr(model, 'tree', None)
+    shared = tree is not None and 'sc' in set_names
+    if shared:
+        sc_pos, tp_pos = set_names.index('sc'), set_names.index('tp')
+    added = 0
+    for pos in positions:
+        index = tuple(s.at(int(i) + 1) for s, i in zip(sets, pos))
+        if shared:  # یک سطر برای هر گره درخت سناریو
+            sc = tree.representative(index[sc_pos], index[tp_pos])
+            index = index[:sc_pos] + (sc,) + index[sc_pos + 1:]
+        if index not in component:
+            component.add(index, rule(model, *index))
+            added += 1
+    return added
+
+
+def row_positions(model, name):
+    # موقعیت سطرهای موجود یک خانواده؛ معکوس add_rows
+    sets = [model.component(s) for s in LAZY_FAMILIES[name][1]]
+    positions = [[s.ord(label) - 1 for s, label in zip(sets, index)] for index in model.component(name)]
+    return np.array(positions, dtype=np.int32).reshape(-1, len(sets))
+
+
+def add_violated_capacity_rows(model, tol=1e-6):
+    return sum(
+        add_rows(model, name, np.argwhere(violated))
+        for name, violated in capacity_violations(model, tol).items()
+    )
+
+
+def solve_lazy(model, solver, max_rounds=None, tol=1e-6, tee=True, **solve_options):
+    """Solve with lazy capacity rows until no row is violated.
+
+    Each round adds at least one of the finitely many rows, so this ends
+    without ``max_rounds``.  If ``max_rounds`` is reached while rows are
+    still violated, the result is marked ``maxIterations``; the solution
+    in ``model`` then is not feasible for the full model.
+    """
+    # حل مدل هسته، افزودن سطرهای نقض‌شده و حل مجدد با شروع گرم تا رسیدن به جواب شدنی
+    options = dict(solve_options)
+    round_ = 0
+    while True:
+        result = solver.solve(model, tee=tee, **options)
+        if result.solver.termination_condition != TerminationCondition.optimal:
+            return result
+        added = add_violated_capacity_rows(model, tol)
+        round_ += 1
+        print(f"Lazy round {round_}: added {added} capacity rows")
+        if added == 0:
+            return result
+        if max_rounds is not None and round_ >= max_rounds:
+            print(f"Lazy constraint generation stopped after {max_rounds} rounds with violated rows remaining.")
+            result.solver.status = SolverStatus.aborted
+            result.solver.termination_condition = TerminationCondition.maxIterations
+            return result
+        if solver.warm_start_capable():
+            options['warmstart'] = True
@@ -0,0 +1,103 @@
+"""Numeric form of the linear model: ``row_lower <= A x <= row_upper``.
+
+``LinearMatrix`` holds the constraint matrix as CSR arrays, the row and
+column bounds, the integrality flags and the objective vector of the
+active part of a model.  Coefficients are collected one constraint at a
+time into typed arrays, so memory is proportional to the number of
+nonzeros rather than to the symbolic expressions.  Constant terms of the
+bodies are moved into the row bounds and fixed variables are treated as
+constants.
+"""
+from array import array
+
+import numpy as np
+from pyomo.environ import Constraint, Objective, maximize, value
+from pyomo.repn import generate_standard_repn
+
+
+def _bound(b, default):
+    return default if b is None else float(value(b))
+
+
+def linear_row(con, column):
+    """Return ``(terms, lower, upper)`` of the active constraint ``con``.
+
+    ``terms`` lists the nonzero ``(column(var), coefficient)`` pairs of the
+    body; its constant is moved into the bounds.  Callers that write one
+    row at a time never hold more than that row in numeric form.
+    """
+    lower, body, upper = con.to_bounded_expression(evaluate_bounds=True)
+    repn = generate_standard_repn(body, compute_values=True, quadratic=False)
+    if repn.nonlinear_expr is not None:
+        raise ValueError(f"constraint {con.name} is not linear")
+    terms = [(column(var), coef) for var, coef in zip(repn.linear_vars, repn.linear_coefs) if coef != 0]
+    constant = value(repn.constant)
+    return terms, _bound(lower, -np.inf) - constant, _bound(upper, np.inf) - constant
+
+
+def linear_objective(model):
+    """Return ``(objective, [(var, coefficient)], constant)`` of the single active objective."""
+    objectives = list(model.component_data_objects(Objective, active=True, descend_into=True))
+    if len(objectives) != 1:
+        raise ValueError(f"expected one active objective, found {len(objectives)}")
+    repn = generate_standard_repn(objectives[0].expr, compute_values=True, quadratic=False)
+    return objectives[0], list(zip(repn.linear_vars, repn.linear_coefs)), float(value(repn.constant))
+
+
+class LinearMatrix:
+
+    def __init__(self, model):
+        self.model = model
+        self.constraints = []
+        self.variables = []
+        column = {}
+
+        def col(var):
+            j = column.get(id(var))
+            if j is None:
+                j = column[id(var)] = len(self.variables)
+                self.variables.append(var)
+            return j
+
+        indptr, indices, data = array('q', [0]), array('q'), array('d')
+        row_lower, row_upper = array('d'), array('d')
+        for con in model.component_data_objects(Constraint, active=True, descend_into=True):
+            terms, lower, upper = linear_row(con, col)
+            for j, coef in terms:
+                indices.append(j)
+                data.append(coef)
+            row_lower.append(lower)
+            row_upper.append(upper)
+            indptr.append(len(indices))
+            self.constraints.append(con)
+
+        self.objective, objective_terms, self.objective_constant = linear_objective(model)
+        objective_terms = [(col(var), coef) for var, coef in objective_terms]
+        self.maximize = self.objective.sense == maximize
+
+        self.indptr = np.frombuffer(indptr, dtype=np.int64)
+        self.indices = np.frombuffer(indices, dtype=np.int64)
+        self.data = np.frombuffer(data, dtype=np.float64)
+        self.row_lower = np.frombuffer(row_lower, dtype=np.float64)
+        self.row_upper = np.frombuffer(row_upper, dtype=np.float64)
+        self.c = np.zeros(len(self.variables))
+        for j, coef in objective_terms:
+            self.c[j] += coef
+        self.col_lower = np.array([_bound(v.lb, -np.inf) for v in self.variables])
+        self.col_upper = np.array([_bound(v.ub, np.inf) for v in self.variables])
+        self.integer = np.array([v.is_integer() for v in self.variables], dtype=bool)
+
+    @property
+    def shape(self):
+        return len(self.constraints), len(self.variables)
+
+    def rows(self):
+        """Row index of every nonzero, in CSR order."""
+        return np.repeat(np.arange(len(self.constraints)), np.diff(self.indptr))
+
+    def csc(self):
+        """Return ``(indptr, row indices, values)`` of the matrix by column."""
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=len(self.variables))
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return indptr, self.rows()[order], self.data[order]
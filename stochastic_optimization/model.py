@@ -0,0 +1,687 @@
+"""Pyomo formulation of the two-stage stochastic refinery supply-chain model."""
+from itertools import product
+
+from pyomo.environ import (
+    Binary,
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Reference,
+    Set,
+    Var,
+    maximize,
+)
+
+from .data import PARAMS, ZERO_DEFAULT
+
+PARAM_DOCS = {
+    'BigM': 'Large constant for constraints',
+    'TAXC': 'Tax per ton of CO2 emitted',
+    'BCK': 'Penalty for backlog',
+    'CAPL': 'Lower capacity limit',
+    'CAPU': 'Upper capacity limit',
+    'DEM': 'Demand for domestic customers',
+    'DEM_oc': 'Demand for overseas customers',
+    'DIS': 'Distance between nodes',
+    'DSR': 'Desulfurization ratio',
+    'EPPU': 'Upper limit of extra product purchase',
+    'EPUP': 'Extra product unit price',
+    'IVU': 'Inventory upper limit at refineries',
+    'IVU_b': 'Inventory upper limit at distribution bases',
+    'IVU_te': 'Inventory upper limit at terminals',
+    'IVUP': 'Inventory unit price at refineries',
+    'IVUP_b': 'Inventory unit price at distribution bases',
+    'IVUP_te': 'Inventory unit price at terminals',
+    'MPU': 'Purchase upper limit for materials',
+    'MUP': 'Material unit price at terminals',
+    'MUP_of': 'Material unit price at oil fields',
+    'MTUP': 'Transportation unit price for materials between nodes',
+    'PTUP': 'Transportation unit price for products between nodes',
+    'PUP': 'Product unit price at terminals',
+    'PUP_b': 'Product unit price at distribution bases',
+    'QBU': 'Backlog upper limit for domestic customers',
+    'QBU_oc': 'Backlog upper limit for overseas customers',
+    'QSU': 'Surplus upper limit for domestic customers',
+    'QSU_oc': 'Surplus upper limit for overseas customers',
+    'ROUP': 'Refinery operation unit price',
+    'SC_m': 'Sulfur content of material',
+    'SC_p': 'Sulfur content of product',
+    'SUR': 'Penalty for surplus production',
+    'TCAU': 'Transportation capacity limit between nodes',
+    'YDR': 'Yield ratio of material to product',
+    'YDR_tp': 'Yield ratio of material to product for time period',
+    'CCOEF': 'Carbon emission coefficient for transportation tool tr',
+    'EC': 'Quantity of CO2 emitted per ton of material operated at refinery r',
+    'PROB': 'Probability of scenario sc',
+}
+
+
+def build_model(data, lazy_capacity=False, tree=None):
+    """Build the extensive-form ``ConcreteModel`` for an instance.
+
+    With ``lazy_capacity`` the capacity families listed in
+    ``lazy.LAZY_FAMILIES`` are declared empty; use ``lazy.solve_lazy`` to
+    add their violated rows on demand.
+
+    With a ``tree.ScenarioTree`` the recourse variables are declared over
+    the tree nodes (``<name>_node``) and ``<name>`` becomes a reference
+    that maps the ``(sc, tp)`` pairs of ``tree.view_keys()`` to the node's
+    variable; the scenario constraints and objective terms are built once
+    per node.
+    """
+    model = ConcreteModel()
+    # ===========================
+    # تعریف مجموعه‌ها
+    # ===========================
+    sets = data['sets']
+    model.m = Set(initialize=sets['m'], doc='Set of materials')
+    model.p = Set(initialize=sets['p'], doc='Set of products')
+    model.tp = Set(initialize=sets['tp'], doc='Set of time periods')
+    model.tr = Set(initialize=sets['tr'], doc='Set of transportation tools')
+    model.sc = Set(initialize=sets['sc'], doc='Set of scenarios')
+    model.b = Set(initialize=sets['b'], doc='Set of distribution bases')
+    model.c = Set(initialize=sets['c'], doc='Set of domestic customers')
+    model.oc = Set(initialize=sets['oc'], doc='Set of overseas customers')
+    model.of = Set(initialize=sets['of'], doc='Set of oil fields')
+    model.r = Set(initialize=sets['r'], doc='Set of refineries')
+    model.te = Set(initialize=sets['te'], doc='Set of terminals')
+    model.n = Set(initialize=sets['n'], doc='Set of nodes in supply chain')
+    model.np = Set(initialize=sets['np'], doc='Set of paired nodes in supply chain')
+    if tree is not None:
+        tree.check(data)
+        model.tree = tree
+        model.node = Set(initialize=tree.nodes, doc='Set of scenario tree nodes')
+
+    # ===========================
+    # تعریف پارامترها
+    # ===========================
+    for name, index_sets in PARAMS.items():
+        model.add_component(name, Param(
+            *(model.component(s) for s in index_sets),
+            initialize=data['params'][name], doc=PARAM_DOCS[name],
+            **({'default': 0} if name in ZERO_DEFAULT else {}),
+        ))
+
+    add_variables(model)
+    model.Obj = Objective(rule=objective_rule, sense=maximize)
+    add_constraints(model, lazy_capacity)
+    return model
+
+
+def add_scenario_var(model, name, *sets, **kwargs):
+    """Declare ``model.<name>`` over ``sets`` x ``model.sc`` x ``model.tp``.
+
+    With a scenario tree only the pairs in ``tree.view_keys()`` exist; use
+    ``tree.representative`` to look up any other scenario.
+    """
+    tree = getattr(model, 'tree', None)
+    if tree is None:
+        model.add_component(name, Var(*sets, model.sc, model.tp, **kwargs))
+        return
+    node_var = Var(*sets, model.node, **kwargs)
+    model.add_component(name + '_node', node_var)
+    keys = tree.view_keys()
+    model.add_component(name, Reference({
+        index + (sc, tp): node_var[index + (tree.node(sc, tp),)]
+        for index in product(*sets) for sc, tp in keys
+    }))
+
+
+def scenario_constraint(model, *sets, rule, **kwargs):
+    """``Constraint`` over sets including ``model.sc`` and ``model.tp``, one row per tree node."""
+    tree = getattr(model, 'tree', None)
+    if tree is None:
+        return Constraint(*sets, rule=rule, **kwargs)
+    sc_pos = next(i for i, s in enumerate(sets) if s is model.sc)
+    tp_pos = next(i for i, s in enumerate(sets) if s is model.tp)
+
+    def node_rule(model, *index):
+        if not tree.is_representative(index[sc_pos], index[tp_pos]):
+            return Constraint.Skip
+        return rule(model, *index)
+    return Constraint(*sets, rule=node_rule, **kwargs)
+
+
+# ===========================
+# تعریف متغیرها
+# ===========================
+def add_variables(model):
+    # Define positive variables
+    add_scenario_var(model, 'qps_oc', model.p, model.oc, model.te, domain=NonNegativeReals,
+                     doc="Quantity of product p sold at time period tp of scenario sc at terminal te to overseas customer oc")
+
+    add_scenario_var(model, 'qps', model.p, model.c, model.b, domain=NonNegativeReals,
+                     doc="Quantity of product p sold at time period tp of scenario sc at distribution b to domestic customer c")
+
+    model.qmp = Var(model.m, model.te, model.r, model.tp, domain=NonNegativeReals,
+                    doc="Quantity of material m purchased by refinery r during time period tp at terminal te")
+
+    model.qmp_of = Var(model.m, model.of, model.r, model.tp, domain=NonNegativeReals,
+                       doc="Quantity of material m purchased by refinery r during time period tp at oil field of")
+
+    model.qmtr = Var(model.m, model.n, model.np, model.tr, model.tp, domain=NonNegativeReals,
+                     doc="Quantity of material m transported from node n to n' by transportation tool tr at time period tp")
+
+    add_scenario_var(model, 'qmo', model.r, model.m, domain=NonNegativeReals,
+                     doc="Quantity of material m operated by refinery r at time period tp of scenario sc")
+
+    add_scenario_var(model, 'qmsto', model.m, model.r, domain=NonNegativeReals,
+                     doc="Quantity of material m stocked at refinery r")
+
+    add_scenario_var(model, 'qpsto', model.p, model.te, domain=NonNegativeReals,
+                     doc="Quantity of product p stocked at terminal te")
+
+    add_scenario_var(model, 'qpsto_b', model.p, model.b, domain=NonNegativeReals,
+                     doc="Quantity of product p stocked at distribution b")
+
+    add_scenario_var(model, 'qptr', model.p, model.n, model.np, model.tr, domain=NonNegativeReals,
+                     doc="Quantity of product p transported by transportation tool tr from node n to n' at tp of scenario sc")
+
+    add_scenario_var(model, 'qepp', model.p, model.te, domain=NonNegativeReals,
+                     doc="Quantity of extra product purchased at terminal te at time period tp of scenario sc")
+
+    add_scenario_var(model, 'qsp', model.p, model.c, domain=NonNegativeReals,
+                     doc="Quantity of surplus product p to be purchased at time period tp of sc by domestic customer c")
+
+    add_scenario_var(model, 'qsp_oc', model.p, model.oc, domain=NonNegativeReals,
+                     doc="Quantity of surplus product p to be purchased at time period tp of sc by overseas customer oc")
+
+    add_scenario_var(model, 'qbp', model.p, model.c, domain=NonNegativeReals,
+                     doc="Quantity of backlog product p needed at time period tp of scenario sc by domestic customer c")
+
+    add_scenario_var(model, 'qbp_oc', model.p, model.oc, domain=NonNegativeReals,
+                     doc="Quantity of backlog product p needed at time period tp of scenario sc by overseas customer oc")
+
+    add_scenario_var(model, 'qpte', model.p, model.r, model.te, domain=NonNegativeReals,
+                     doc="Quantity of product p produced by refinery r sold at tp of scenario sc at terminal te")
+
+    add_scenario_var(model, 'qpb', model.p, model.r, model.b, domain=NonNegativeReals,
+                     doc="Quantity of product p produced by refinery r sold at tp of scenario sc at distribution b")
+
+    add_scenario_var(model, 'qepb', model.p, model.b, model.te, domain=NonNegativeReals,
+                     doc="Quantity of extra product p purchased at te to be sold at distribution b at time period tp of scenario sc")
+
+    # Binary variables
+    add_scenario_var(model, 'iqsp', model.p, model.c, domain=Binary,
+                     doc="Binary variable of surplus product by domestic customer c")
+
+    add_scenario_var(model, 'iqsp_oc', model.p, model.oc, domain=Binary,
+                     doc="Binary variable of surplus product by overseas customer oc")
+
+    add_scenario_var(model, 'iqbp', model.p, model.c, domain=Binary,
+                     doc="Binary variable of backlog product by domestic customer c")
+
+    add_scenario_var(model, 'iqbp_oc', model.p, model.oc, domain=Binary,
+                     doc="Binary variable of backlog product by overseas customer oc")
+
+    # تعریف متغیرها
+    model.pf = Var(model.p, model.n, model.np, model.tr, model.tp, domain=NonNegativeReals,
+                   doc="Flow of product p from node n to node np by transportation tool tr at time period tp")
+
+    add_scenario_var(
+        model, 'pf_r_b', model.p, model.r, model.b, model.tr,
+        within=NonNegativeReals,
+        doc='Flow of product p from refinery r to distribution b by transportation tool tr at time period tp of scenario sc'
+    )
+
+    add_scenario_var(
+        model, 'pf_r_te', model.p, model.r, model.te, model.tr,
+        within=NonNegativeReals,
+        doc='Flow of product p from refinery r to terminal te by transportation tool tr at time period tp of scenario sc'
+    )
+
+    add_scenario_var(
+        model, 'pf_b_c', model.p, model.b, model.c, model.tr,
+        within=NonNegativeReals,
+        doc='Flow of product p from distribution b to domestic customer c by transportation tool tr at time period tp of scenario sc'
+    )
+
+    add_scenario_var(
+        model, 'pf_te_oc', model.p, model.te, model.oc, model.tr,
+        within=NonNegativeReals,
+        doc='Flow of product p from terminal te to overseas customer oc by transportation tool tr at time period tp of scenario sc'
+    )
+
+    add_scenario_var(
+        model, 'pf_te_b', model.p, model.te, model.b, model.tr,
+        within=NonNegativeReals,
+        doc='Flow of product p from terminal te to distribution b by transportation tool tr at time period tp of scenario sc'
+    )
+
+    model.pf_n_np = Var(
+        model.p, model.n, model.np, model.tr, model.tp,
+        within=NonNegativeReals,
+        doc='Flow of product p from node n to node n\' by transportation tool tr at time period tp'
+    )
+    # تعریف متغیرها
+    model.mf = Var(
+        model.m, model.n, model.np, model.tr, model.tp,
+        within=NonNegativeReals,
+        doc='Flow of material m from node n to node n\' by transportation tool tr at time period tp'
+    )
+
+    model.mf_te_r = Var(
+        model.m, model.te, model.r, model.tr, model.tp,
+        within=NonNegativeReals,
+        doc='Flow of material m from terminal te to refinery r by transportation tool tr at time period tp'
+    )
+
+    model.mf_of_r = Var(
+        model.m, model.of, model.r, model.tr, model.tp,
+        within=NonNegativeReals,
+        doc='Flow of material m from oil field of to refinery r by transportation tool tr at time period tp'
+    )
+
+
+# ===========================
+# تابع هدف
+# ===========================
+
+def scenario_periods(model):
+    """``(sc, tp, weight)`` of the scenario-dependent objective terms.
+
+    Without a tree every scenario period has weight ``PROB[sc]``.  With a
+    tree every node appears once, through its first scenario, weighted by
+    the summed probability of its scenarios.
+    """
+    tree = getattr(model, 'tree', None)
+    if tree is None:
+        return [(sc, tp, model.PROB[sc]) for sc in model.sc for tp in model.tp]
+    return [
+        (members[0], tree.period_of[node], sum(model.PROB[sc] for sc in members))
+        for node, members in tree.members.items()
+    ]
+
+
+# تعریف تابع هدف
+def objective_rule(model):
+
+    # هزینه مواد اولیه
+    Cmp = (
+        sum(model.MUP[m, te, tp] * model.qmp[m, te, r, tp]
+            for m in model.m for te in model.te for r in model.r for tp in model.tp) +
+        sum(model.MUP_of[m, of_, tp] * model.qmp_of[m, of_, r, tp]
+            for m in model.m for of_ in model.of for r in model.r for tp in model.tp)
+    )
+
+    # هزینه حمل و نقل مواد اولیه
+    Cmtr = sum(
+        model.MTUP[m, n, np, tr, tp] * model.DIS[n, np] * model.qmtr[m, n, np, tr, tp]
+        for m in model.m for n in model.n for np in model.np for tr in model.tr for tp in model.tp
+    )
+
+    # مالیات انتشار کربن
+    Cctax = (
+        model.TAXC * sum(
+            model.CCOEF[tr] * model.DIS[n, np] * model.qmtr[m, n, np, tr, tp]
+            for m in model.m for n in model.n for np in model.np for tr in model.tr for tp in model.tp
+        ) +
+        sum(
+            weight * (
+                model.TAXC * sum(model.EC[r] * model.qmo[r, m, sc, tp]
+                                 for r in model.r for m in model.m) +
+                model.TAXC * sum(
+                    model.CCOEF[tr] * model.DIS[n, np] * model.qptr[p, n, np, tr, sc, tp]
+                    for p in model.p for n in model.n for np in model.np for tr in model.tr
+                )
+            )
+            for sc, tp, weight in scenario_periods(model)
+        )
+    )
+
+    # هزینه‌های مربوط به هر سناریو
+    scenario_costs = sum(
+        weight * (
+            # فروش
+            (
+             +   sum(model.PUP[p, te, sc, tp] * model.qps_oc[p, oc, te, sc, tp]
+                    for p in model.p for oc in model.oc for te in model.te) +
+                sum(model.PUP_b[p, b, sc, tp] * model.qps[p, c, b, sc, tp]
+                    for p in model.p for c in model.c for b in model.b)
+            )
+            # هزینه عملیات پالایشگاه
+            - sum(model.ROUP[r, m, tp] * model.qmo[r, m, sc, tp]
+                  for r in model.r for m in model.m)
+            # هزینه‌های عملیاتی و ذخیره‌سازی
+            - (
+                sum(model.IVUP[m, r, tp] * model.qmsto[m, r, sc, tp]
+                    for m in model.m for r in model.r) +
+                sum(model.IVUP_te[p, te, tp] * model.qpsto[p, te, sc, tp]
+                    for p in model.p for te in model.te) +
+                sum(model.IVUP_b[p, b, tp] * model.qpsto_b[p, b, sc, tp]
+                    for p in model.p for b in model.b)
+            )
+            # هزینه‌های حمل و نقل محصولات
+            - (sum(
+                model.PTUP[p, n, np, tr, tp] * model.DIS[n, np] * model.qptr[p, n, np, tr, sc, tp]
+                for p in model.p for n in model.n for np in model.np for tr in model.tr
+            )
+              )
+            # هزینه خرید محصولات اضافی
+            - (sum(model.EPUP[p, te, tp] * model.qepp[p, te, sc, tp]
+                  for p in model.p for te in model.te)
+              )
+            # هزینه مازاد
+            - (
+                sum(model.SUR[p, tp] * model.qsp[p, c, sc, tp]
+                    for p in model.p for c in model.c) +
+                sum(model.SUR[p, tp] * model.qsp_oc[p, oc, sc, tp]
+                    for p in model.p for oc in model.oc)
+            )
+            # هزینه کمبود
+            - (
+                sum(model.BCK[p, tp] * model.qbp[p, c, sc, tp]
+                    for p in model.p for c in model.c) +
+                sum(model.BCK[p, tp] * model.qbp_oc[p, oc, sc, tp]
+                    for p in model.p for oc in model.oc)
+            )
+        )
+        for sc, tp, weight in scenario_periods(model)
+    )
+
+    # بازگشت تابع هدف
+    return -Cmp - Cmtr - Cctax + scenario_costs
+
+
+# ===========================
+# قیود
+# ===========================
+def lazy_rule(lazy, rule):
+    # در حالت تنبل، قیود ظرفیت ساخته نمی‌شوند و فقط سطرهای نقض‌شده بعداً اضافه می‌شوند
+    if not lazy:
+        return rule
+    return lambda model, *index: Constraint.Skip
+
+
+# قید تعادل مواد
+def material_balance_rule(model, m, r, tp, sc):
+    if tp == model.tp.first():  # شرط برای دوره اول
+        return (
+            sum(model.qmp[m, te, r, tp] for te in model.te) +
+            sum(model.qmp_of[m, of, r, tp] for of in model.of)
+            ==
+            model.qmo[r, m, sc, tp]+ model.qmsto[m, r, sc, tp]
+        )
+    else:  # برای دوره‌های دیگر
+        return (
+            sum(model.qmp[m, te, r, tp] for te in model.te) +
+            sum(model.qmp_of[m, of, r, tp] for of in model.of) +
+            model.qmsto[m, r, sc, model.tp.prev(tp)]
+            ==
+            model.qmo[r, m, sc, tp] + model.qmsto[m, r, sc, tp]
+        )
+
+
+# قید محدودیت ظرفیت جریان مواد
+def transport_capacity_rule(model, n, np, tr, tp):
+    return (
+        sum(model.mf[m, n, np, tr, tp] for m in model.m) +
+        sum(model.pf[p, n, np, tr, tp] for p in model.p)
+        <= model.TCAU[n, np, tr, tp]
+    )
+
+
+def flow_terminal_to_refinery_rule(model, m, te, r, tp):
+    return model.qmp[m, te, r, tp] == sum(model.mf_te_r[m, te, r, tr, tp] for tr in model.tr)
+
+
+def flow_oilfield_to_refinery_rule(model, m, of, r, tp):
+    return model.qmp_of[m, of, r, tp] == sum(model.mf_of_r[m, of, r, tr, tp] for tr in model.tr)
+
+def flow_refinery_to_base_rule(model, p, r, b, sc, tp):
+    return model.qpb[p, r, b, sc, tp] == sum(model.pf_r_b[p, r, b, tr, sc, tp] for tr in model.tr)
+def flow_refinery_to_terminal_rule(model, p, r, te, sc, tp):
+    return model.qpte[p, r, te, sc, tp] == sum(model.pf_r_te[p, r, te, tr, sc, tp] for tr in model.tr)
+
+def flow_base_to_customer_rule(model, p, b, c, sc, tp):
+    return model.qps[p, c, b, sc, tp] == sum(model.pf_b_c[p, b, c, tr, sc, tp] for tr in model.tr)
+def flow_terminal_to_overseas_customer_rule(model, p, te, oc, sc, tp):
+    return model.qps_oc[p, oc, te, sc, tp] == sum(model.pf_te_oc[p, te, oc, tr, sc, tp] for tr in model.tr)
+def flow_terminal_to_base_rule(model, p, te, b, sc, tp):
+    return model.qepb[p, b, te, sc, tp] == sum(model.pf_te_b[p, te, b, tr, sc, tp] for tr in model.tr)
+
+# قید تعادل محصولات
+
+def product_balance_rule1(model, m, p, r, tp, sc):
+    return (
+        model.qmo[r, m, sc, tp] * model.YDR[r, m, p] ==
+        sum(model.qpte[p, r, te, sc, tp] for te in model.te) +
+        sum(model.qpb[p, r, b, sc, tp] for b in model.b)
+    )
+
+
+def product_balance_rule2(model, p, te, tp, sc):
+    if tp == model.tp.first():
+        return (
+            sum(model.qpte[p, r, te, sc, tp] for r in model.r) +
+            model.qepp[p, te, sc, tp] -
+            sum(model.qepb[p, b, te, sc, tp] for b in model.b) ==
+            sum(model.qps_oc[p, oc, te, sc, tp] for oc in model.oc) +
+            model.qpsto[p, te, sc, tp]
+        )
+    else:
+        return (
+            sum(model.qpte[p, r, te, sc, tp] for r in model.r) +
+            model.qepp[p, te, sc, tp] -
+            sum(model.qepb[p, b, te, sc, tp] for b in model.b) +
+            model.qpsto[p, te, sc, model.tp.prev(tp)] ==
+            sum(model.qps_oc[p, oc, te, sc, tp] for oc in model.oc) +
+            model.qpsto[p, te, sc, tp]
+        )
+
+
+def product_balance_rule3(model, p, b, tp, sc):
+    if tp == model.tp.first():
+        return (
+            sum(model.qpb[p, r, b, sc, tp] for r in model.r) +
+            sum(model.qepb[p, b, te, sc, tp] for te in model.te) ==
+            sum(model.qps[p, c, b, sc, tp] for c in model.c) +
+            model.qpsto_b[p, b, sc, tp]
+        )
+    else:
+        return (
+            sum(model.qpb[p, r, b, sc, tp] for r in model.r) +
+            sum(model.qepb[p, b, te, sc, tp] for te in model.te) +
+            model.qpsto_b[p, b, sc, model.tp.prev(tp)] ==
+            sum(model.qps[p, c, b, sc, tp] for c in model.c) +
+            model.qpsto_b[p, b, sc, tp]
+        )
+
+
+# قید محدودیت موجودی در پایانه
+def terminal_inventory_rule(model, p, te, tp, sc):
+    tp_index = list(model.tp).index(tp)
+    if tp_index > 0:
+        prev_tp = list(model.tp)[tp_index - 1]
+        return (
+            sum(model.qpte[p, r, te, sc, tp] for r in model.r) +
+            model.qepp[p, te, sc, tp] +
+            model.qpsto[p, te, sc, prev_tp]
+            ==
+            sum(model.qps_oc[p, oc, te, sc, tp] for oc in model.oc) +
+            model.qpsto[p, te, sc, tp]
+        )
+    else:
+        return (
+            sum(model.qpte[p, r, te, sc, tp] for r in model.r) +
+            model.qepp[p, te, sc, tp]
+            ==
+            sum(model.qps_oc[p, oc, te, sc, tp] for oc in model.oc) +
+            model.qpsto[p, te, sc, tp]
+        )
+
+
+# قید محدودیت موجودی در مرکز توزیع
+def distribution_inventory_rule(model, p, b, tp, sc):
+    tp_index = list(model.tp).index(tp)
+    if tp_index > 0:
+        prev_tp = list(model.tp)[tp_index - 1]
+        return (
+            sum(model.qpb[p, r, b, sc, tp] for r in model.r) +
+            sum(model.qepb[p, b, te, sc, tp] for te in model.te) +
+            model.qpsto_b[p, b, sc, prev_tp]
+            ==
+            sum(model.qps[p, c, b, sc, tp] for c in model.c) +
+            model.qpsto_b[p, b, sc, tp]
+        )
+    else:
+        return (
+            sum(model.qpb[p, r, b, sc, tp] for r in model.r) +
+            sum(model.qepb[p, b, te, sc, tp] for te in model.te)
+            ==
+            sum(model.qps[p, c, b, sc, tp] for c in model.c) +
+            model.qpsto_b[p, b, sc, tp]
+        )
+
+
+# قید محدودیت کیفیت
+def sulfur_content_rule(model, p, r, tp, sc):
+    return (
+        sum(model.qmo[r, m, sc, tp] * model.SC_m[m, tp] * model.YDR[r, m, p] * (1 - model.DSR[r, m])
+            for m in model.m)
+        <=
+    (sum(model.qmo[r, m, sc, tp] * model.YDR_tp[r, m, tp] for m in model.m)) * model.SC_p[p, tp]
+    )
+
+
+# قید محدودیت ظرفیت خرید مواد اولیه
+def procurement_capacity_material_rule(model, m, te, of, tp):
+    return (
+        sum(model.qmp[m, te, r, tp] for te in model.te for r in model.r) +
+        sum(model.qmp_of[m, of, r, tp] for r in model.r)
+        <= model.MPU[m, tp]
+    )
+
+
+# قید محدودیت خرید محصولات اضافی
+def procurement_capacity_extra_rule(model, p, tp, sc):
+    return (
+        sum(model.qepp[p, te, sc, tp] for te in model.te)
+        <= model.EPPU[p, tp]
+    )
+
+
+# قید محدودیت عملیات پالایشگاه
+def refinery_operation_rule_lower(model, r, m, tp, sc):
+    return model.qmo[r, m, sc, tp] >= model.CAPL[r, m, tp]
+
+def refinery_operation_rule_upper(model, r, m, tp, sc):
+    return model.qmo[r, m, sc, tp] <= model.CAPU[r, m, tp]
+
+
+# قید ظرفیت موجودی مواد
+def inventory_capacity_material_rule(model, m, r, sc, tp):
+    return model.qmsto[m, r, sc, tp] <= model.IVU[m, r, tp]
+
+
+# قید ظرفیت موجودی محصولات در پایانه
+def inventory_capacity_product_terminal_rule(model, p, te, sc, tp):
+    return model.qpsto[p, te, sc, tp] <= model.IVU_te[p, te, tp]
+
+
+# قید ظرفیت موجودی محصولات در مرکز توزیع
+def inventory_capacity_product_distribution_rule(model, p, b, sc, tp):
+    return model.qpsto_b[p, b, sc, tp] <= model.IVU_b[p, b, tp]
+
+
+# قید تقاضای مشتریان خارجی
+def demand_external_rule(model, p, oc, te, sc, tp):
+    return model.qps_oc[p, oc, te, sc, tp] == model.DEM_oc[p, oc, sc, tp] + model.qsp_oc[p, oc, sc, tp] - model.qbp_oc[p, oc, sc, tp]
+
+
+# قید تقاضای مشتریان داخلی
+def demand_internal_rule(model, p, c, b, sc, tp):
+    return model.qps[p, c, b, sc, tp] == model.DEM[p, c, sc, tp] + model.qsp[p, c, sc, tp] - model.qbp[p, c, sc, tp]
+
+
+#  حداکثر کمبود برای مشتریان خارجی
+def backlog_limit_external_rule(model, p, oc, sc, tp):
+    return model.qbp_oc[p, oc, sc, tp] <= model.iqbp_oc[p, oc, sc, tp] * model.QBU_oc[p, oc, tp]
+
+
+# قید حداکثر مازاد برای مشتریان داخلی
+def surplus_limit_internal_rule(model, p, c, sc, tp):
+    return model.qsp[p, c, sc, tp] <= model.iqsp[p, c, sc, tp] * model.QSU[p, c, tp]
+
+
+# قید حداکثر مازاد برای مشتریان خارجی
+def surplus_limit_external_rule (model, p, oc, tp, sc):
+    return model.qsp_oc[p, oc, sc, tp] <= model.iqsp_oc[p, oc, sc, tp] * model.QSU_oc[p, oc, tp]
+
+
+# قید حداکثر کمبود برای مشتریان داخلی
+def backlog_limit_internal_rule(model, p, c, sc, tp):
+    return model.qbp[p, c, sc, tp] <= model.iqbp[p, c, sc, tp] * model.QBU[p, c, tp]
+
+
+# قید منطقی مازاد و کمبود برای مشتریان خارجی
+def logical_constraint_external_rule(model, p, oc, sc, tp):
+    return model.iqsp_oc[p, oc, sc, tp] + model.iqbp_oc[p, oc, sc, tp] <= 1
+
+
+# قید منطقی مازاد و کمبود برای مشتریان داخلی
+def logical_constraint_internal_rule(model, p, c, sc, tp):
+    return model.iqsp[p, c, sc, tp] + model.iqbp[p, c, sc, tp] <= 1
+
+
+def add_constraints(model, lazy_capacity=False):
+    model.MaterialBalance = scenario_constraint(model, model.m, model.r, model.tp, model.sc, rule=material_balance_rule)
+    model.transport_capacity = Constraint(model.n, model.np, model.tr, model.tp, rule=lazy_rule(lazy_capacity, transport_capacity_rule))
+    model.flow_terminal_to_refinery_constraint = Constraint(
+        model.m, model.te, model.r, model.tp,
+        rule=flow_terminal_to_refinery_rule,
+        doc="Flow of material from terminal to refinery"
+    )
+    model.flow_oilfield_to_refinery_constraint = Constraint(
+        model.m, model.of, model.r, model.tp,
+        rule=flow_oilfield_to_refinery_rule,
+        doc="Flow of material from oilfield to refinery"
+    )
+    model.flow_refinery_to_base_constraint = scenario_constraint(
+        model, model.p, model.r, model.b, model.sc, model.tp,
+        rule=flow_refinery_to_base_rule,
+        doc="Flow of product from refinery to base"
+    )
+    model.flow_refinery_to_terminal_constraint = scenario_constraint(
+        model, model.p, model.r, model.te, model.sc, model.tp,
+        rule=flow_refinery_to_terminal_rule,
+        doc="Flow of product from refinery to terminal"
+    )
+    model.flow_base_to_customer_constraint = scenario_constraint(
+        model, model.p, model.b, model.c, model.sc, model.tp,
+        rule=flow_base_to_customer_rule,
+        doc="Flow of product from base to customer"
+    )
+    model.flow_terminal_to_overseas_customer_constraint = scenario_constraint(
+        model, model.p, model.te, model.oc, model.sc, model.tp,
+        rule=flow_terminal_to_overseas_customer_rule,
+        doc="Flow of product from terminal to overseas customer"
+    )
+    model.flow_terminal_to_base_constraint = scenario_constraint(
+        model, model.p, model.te, model.b, model.sc, model.tp,
+        rule=flow_terminal_to_base_rule,
+        doc="Flow of product from terminal to base"
+    )
+    model.product_balance1 = scenario_constraint(model, model.m, model.p, model.r, model.tp, model.sc, rule=product_balance_rule1)
+    model.product_balance2 = scenario_constraint(model, model.p, model.te, model.tp, model.sc, rule=product_balance_rule2)
+    model.product_balance3 = scenario_constraint(model, model.p, model.b, model.tp, model.sc, rule=product_balance_rule3)
+    model.TerminalInventory = scenario_constraint(model, model.p, model.te, model.tp, model.sc, rule=terminal_inventory_rule)
+    model.DistributionInventory = scenario_constraint(model, model.p, model.b, model.tp, model.sc, rule=distribution_inventory_rule)
+    model.SulfurContent = scenario_constraint(model, model.p, model.r, model.tp, model.sc, rule=sulfur_content_rule)
+    model.ProcurementCapacityMaterial = Constraint(model.m, model.te, model.of, model.tp, rule=lazy_rule(lazy_capacity, procurement_capacity_material_rule))
+    model.ProcurementCapacityExtra = scenario_constraint(model, model.p, model.tp, model.sc, rule=procurement_capacity_extra_rule)
+    model.RefineryOperationLower = scenario_constraint(model, model.r, model.m, model.tp, model.sc, rule=refinery_operation_rule_lower)
+    model.RefineryOperationUpper = scenario_constraint(model, model.r, model.m, model.tp, model.sc, rule=refinery_operation_rule_upper)
+    model.InventoryCapacityMaterial = scenario_constraint(model, model.m, model.r, model.sc, model.tp, rule=lazy_rule(lazy_capacity, inventory_capacity_material_rule))
+    model.InventoryCapacityProductTerminal = scenario_constraint(model, model.p, model.te, model.sc, model.tp, rule=lazy_rule(lazy_capacity, inventory_capacity_product_terminal_rule))
+    model.InventoryCapacityProductDistribution = scenario_constraint(model, model.p, model.b, model.sc, model.tp, rule=lazy_rule(lazy_capacity, inventory_capacity_product_distribution_rule))
+    model.DemandExternal = scenario_constraint(model, model.p, model.oc, model.te, model.sc, model.tp, rule=demand_external_rule)
+    model.DemandInternal = scenario_constraint(model, model.p, model.c, model.b, model.sc, model.tp, rule=demand_internal_rule)
+    model.BacklogLimitExternal = scenario_constraint(model, model.p, model.oc, model.sc, model.tp, rule=backlog_limit_external_rule)
+    model.SurplusLimitInternal = scenario_constraint(model, model.p, model.c, model.sc, model.tp, rule=surplus_limit_internal_rule)
+    model.surplusLimitExternal = scenario_constraint(model, model.p, model.oc, model.tp, model.sc, rule=surplus_limit_external_rule)
+    model.BacklogLimitInternal = scenario_constraint(model, model.p, model.c, model.sc, model.tp, rule=backlog_limit_internal_rule)
+    model.LogicalConstraintExternal = scenario_constraint(model, model.p, model.oc, model.sc, model.tp, rule=logical_constraint_external_rule)
+    model.LogicalConstraintInternal = scenario_constraint(model, model.p, model.c, model.sc, model.tp, rule=logical_constraint_internal_rule)
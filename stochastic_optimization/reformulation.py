@@ -0,0 +1,88 @@
+"""Elimination of the surplus/backlog exclusivity binaries.
+
+``iqsp``/``iqbp`` (and their ``_oc`` counterparts) only keep surplus and
+backlog from both being positive.  Surplus and backlog enter the demand
+constraints only through their difference, and the objective through
+``-PROB * (SUR * qsp + BCK * qbp)``.  So when ``PROB >= 0`` and
+``SUR + BCK >= 0``, lowering both by their minimum never makes a solution
+worse.  The LP with plain bounds ``qsp <= QSU``, ``qbp <= QBU`` then has
+the same optimal value as the MILP, and ``restore_exclusivity`` turns its
+solution into one that satisfies the original logical constraints.
+Negative ``QSU``/``QBU`` would make the bounds stricter than the binary
+form, so they also disable the reformulation.
+"""
+from itertools import product
+
+# (surplus, backlog, surplus binary, backlog binary, surplus limit, backlog limit, customer set)
+EXCLUSIVE_PAIRS = (
+    ('qsp', 'qbp', 'iqsp', 'iqbp', 'QSU', 'QBU', 'c'),
+    ('qsp_oc', 'qbp_oc', 'iqsp_oc', 'iqbp_oc', 'QSU_oc', 'QBU_oc', 'oc'),
+)
+BINARY_CONSTRAINTS = (
+    'SurplusLimitInternal',
+    'surplusLimitExternal',
+    'BacklogLimitInternal',
+    'BacklogLimitExternal',
+    'LogicalConstraintInternal',
+    'LogicalConstraintExternal',
+)
+
+
+def binary_elimination_blockers(data):
+    """Return the reasons the binaries cannot be dropped for ``data`` (empty if they can)."""
+    sets, params = data['sets'], data['params']
+    reasons = [f"PROB[{sc}] = {v} is negative" for sc, v in params['PROB'].items() if v < 0]
+    for p, tp in product(sets['p'], sets['tp']):
+        sur, bck = params['SUR'].get((p, tp)), params['BCK'].get((p, tp))
+        if sur is None or bck is None:
+            reasons.append(f"SUR/BCK[{p}, {tp}] is undefined")
+        elif sur + bck < 0:
+            reasons.append(f"SUR + BCK at [{p}, {tp}] is negative")
+    for *_, surplus_limit, backlog_limit, customers in EXCLUSIVE_PAIRS:
+        for limit in (surplus_limit, backlog_limit):
+            for index in product(sets['p'], sets[customers], sets['tp']):
+                v = params[limit].get(index)
+                if v is None:
+                    reasons.append(f"{limit}[{', '.join(index)}] is undefined")
+                elif v < 0:
+                    reasons.append(f"{limit}[{', '.join(index)}] is negative")
+    return reasons
+
+
+def eliminate_binaries(model, data):
+    """Replace the binary exclusivity logic by bounds if ``data`` allows it.
+
+    The binaries are fixed and their constraints deactivated, so the model
+    can be restored by unfixing and reactivating them.  Returns True if the
+    reformulation was applied; otherwise the model is left as a MILP.
+    """
+    reasons = binary_elimination_blockers(data)
+    if reasons:
+        print("Keeping surplus/backlog binaries: " + '; '.join(reasons[:3])
+              + (f" (and {len(reasons) - 3} more)" if len(reasons) > 3 else ''))
+        return False
+    for surplus, backlog, surplus_bin, backlog_bin, surplus_limit, backlog_limit, _ in EXCLUSIVE_PAIRS:
+        for var, limit in ((surplus, surplus_limit), (backlog, backlog_limit)):
+            bound = model.component(limit)
+            for (p, k, sc, tp), v in model.component(var).items():
+                v.setub(bound[p, k, tp])
+        for name in (surplus_bin, backlog_bin):
+            model.component(name).fix(0)
+    for name in BINARY_CONSTRAINTS:
+        model.component(name).deactivate()
+    print("Surplus/backlog binaries eliminated; solving the LP reformulation.")
+    return True
+
+
+def restore_exclusivity(model):
+    # مازاد و کمبود را به اندازه کمینه هر دو کاهش می‌دهد و متغیرهای دودویی را مطابق آن مقداردهی می‌کند
+    for surplus, backlog, surplus_bin, backlog_bin, *_ in EXCLUSIVE_PAIRS:
+        qsp, qbp = model.component(surplus), model.component(backlog)
+        iqsp, iqbp = model.component(surplus_bin), model.component(backlog_bin)
+        for index in qsp:
+            s, b = qsp[index].value or 0, qbp[index].value or 0
+            shift = min(s, b)
+            qsp[index].set_value(s - shift)
+            qbp[index].set_value(b - shift)
+            iqsp[index].set_value(1 if s - shift > 0 else 0)
+            iqbp[index].set_value(1 if b - shift > 0 else 0)
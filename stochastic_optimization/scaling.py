@@ -0,0 +1,123 @@
+"""Row and column scaling of the constraint matrix.
+
+``scaling_factors`` computes factors from the linear coefficients of the
+active constraints with either geometric-mean scaling (a few alternating
+row/column passes that bring ``max * min`` of every row and column
+towards 1) or equilibration (largest entry of every row and column to 1).
+Factors are rounded to powers of two so that scaling adds no rounding
+error.  Integer columns keep the factor 1: ``core.scale_model`` scales
+their bounds but not their domain, so any other factor would change the
+set of feasible integer values.  The objective gets a factor that brings
+its largest coefficient into the same range.
+
+``scale_model`` stores the factors in a ``scaling_factor`` suffix and
+applies Pyomo's ``core.scale_model`` transformation to a copy of the
+model.  ``unscale_solution`` maps the primal values and, if both models
+carry a ``dual`` suffix, the duals of the active constraints back onto
+the original model.
+"""
+import numpy as np
+from pyomo.common.collections import ComponentMap
+from pyomo.environ import Constraint, Objective, Suffix, TransformationFactory
+
+from .matrix import LinearMatrix
+
+METHODS = ('geometric', 'equilibration')
+
+
+def _extreme(index, values, size, ufunc, empty):
+    out = np.full(size, empty)
+    ufunc.at(out, index, values)
+    return out
+
+
+def _power_of_two(x):
+    return np.exp2(np.round(np.log2(x)))
+
+
+def _geometric_mean(largest, smallest):
+    # rows and columns without nonzeros keep their factor
+    return np.where(largest > 0, np.sqrt(largest * np.where(largest > 0, smallest, 1.0)), 1.0)
+
+
+def scaling_factors(model, method='geometric', passes=4):
+    """Return ``(constraint_factors, variable_factors, objective_factor)``.
+
+    Factors follow the ``core.scale_model`` convention: a constraint is
+    multiplied by its factor and a variable is replaced by ``factor * var``,
+    so its column is divided by the factor.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown scaling method {method!r}; expected one of {METHODS}")
+    matrix = LinearMatrix(model)
+    constraints, variables = matrix.constraints, matrix.variables
+    rows, cols, vals = matrix.rows(), matrix.indices, np.abs(matrix.data)
+    row_scale = np.ones(len(constraints))
+    col_scale = np.ones(len(variables))
+    continuous = ~matrix.integer
+    if len(vals):
+        for _ in range(passes if method == 'geometric' else 1):
+            scaled = vals * row_scale[rows] * col_scale[cols]
+            row_max = _extreme(rows, scaled, len(constraints), np.maximum, 0.0)
+            if method == 'geometric':
+                row_min = _extreme(rows, scaled, len(constraints), np.minimum, np.inf)
+                row_scale /= _geometric_mean(row_max, row_min)
+            else:
+                row_scale /= np.where(row_max > 0, row_max, 1.0)
+            scaled = vals * row_scale[rows] * col_scale[cols]
+            col_max = _extreme(cols, scaled, len(variables), np.maximum, 0.0)
+            if method == 'geometric':
+                col_min = _extreme(cols, scaled, len(variables), np.minimum, np.inf)
+                col_scale /= np.where(continuous, _geometric_mean(col_max, col_min), 1.0)
+            else:
+                col_scale /= np.where(continuous & (col_max > 0), col_max, 1.0)
+    row_scale = _power_of_two(row_scale)
+    col_scale = np.where(continuous, _power_of_two(col_scale), 1.0)
+
+    objective = np.abs(matrix.c) * col_scale
+    objective_factor = float(_power_of_two(1.0 / objective.max())) if objective.any() else 1.0
+    return (
+        ComponentMap(zip(constraints, row_scale.tolist())),
+        ComponentMap((var, 1.0 / s) for var, s in zip(variables, col_scale.tolist())),
+        objective_factor,
+    )
+
+
+def scale_model(model, method='geometric'):
+    """Return a scaled copy of ``model``.
+
+    The original only gains the ``scaling_factor`` suffix holding the factors.
+    """
+    constraint_factors, variable_factors, objective_factor = scaling_factors(model, method)
+    suffix = model.component('scaling_factor')
+    if suffix is None:
+        suffix = model.scaling_factor = Suffix(direction=Suffix.EXPORT)
+    suffix.clear()
+    for component, factor in list(constraint_factors.items()) + list(variable_factors.items()):
+        if factor != 1.0:
+            suffix[component] = factor
+    for obj in model.component_data_objects(Objective, active=True):
+        suffix[obj] = objective_factor
+    return TransformationFactory('core.scale_model').create_using(model)
+
+
+def unscale_solution(scaled_model, model):
+    """Copy the solution of ``scaled_model`` back onto ``model``.
+
+    Duals are copied here rather than by ``propagate_solution``, which
+    expects one for every constraint, deactivated ones included.
+    """
+    duals = scaled_model.component('dual')
+    if duals is not None:
+        scaled_model.del_component(duals)
+    TransformationFactory('core.scale_model').propagate_solution(scaled_model, model)
+    if duals is None or model.component('dual') is None:
+        return
+    factors = scaled_model.component_scaling_factor_map
+    names = scaled_model.scaled_component_to_original_name_map
+    objective_factor = factors[next(scaled_model.component_data_objects(Objective, active=True))]
+    for scaled in scaled_model.component_objects(Constraint, active=True):
+        original = model.find_component(names[scaled])
+        for index, row in scaled.items():
+            if row.active and row in duals:
+                model.dual[original[index]] = duals[row] * factors[row] / objective_factor
@@ -0,0 +1,276 @@
+"""Local solve service: an HTTP job queue in front of warm worker processes.
+
+Endpoints (JSON, bound to 127.0.0.1 by default):
+
+``POST /jobs``
+    Body ``{"data": <instance JSON>, "backend": "glpk", "lazy_capacity": false}``.
+    The job id is ``solution.result_key`` of the instance and options, so
+    identical submissions share one job and one cached result.
+``GET /jobs/<id>``
+    Job state (``queued``, ``running``, ``done``, ``failed``) and, once
+    done, the solution in the ``solution.to_json`` format.
+``GET /jobs/<id>/events``
+    Newline-delimited JSON stream of state changes and solver progress
+    (``incumbent``, ``bound``, ``gap``) until the job finishes.
+``GET /health``
+    Worker count and number of jobs held in memory.
+
+Each worker imports Pyomo and locates the solver once, in the pool
+initializer, and all workers are started when the queue is created, so
+a job only pays for model construction and the solve.  With a result
+cache, an optimal job is dropped from memory once its solution is
+cached; requests for it are then answered from the cache.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .data import from_json, validate
+from .solution import ResultCache, result_key, to_json
+
+FINAL_STATES = ('done', 'failed')
+
+# '>>>>>' marks the line on which GLPK reports a new incumbent, 'mip =' its periodic status
+_GLPK_PROGRESS = re.compile(r'(?:mip =|>>>>>)\s+(\S+)\s+[<>]=\s+(\S+)')
+_CBC_PROGRESS = re.compile(r'Cbc0010I After \d+ nodes, \d+ on tree, (\S+) best solution, best possible (\S+)')
+
+
+def parse_progress(line):
+    """Return ``(incumbent, bound)`` from a GLPK or CBC log line, or None."""
+    match = _GLPK_PROGRESS.search(line) or _CBC_PROGRESS.search(line)
+    if match is None:
+        return None
+    try:
+        incumbent, bound = float(match.group(1)), float(match.group(2))
+    except ValueError:  # e.g. "mip = not found yet" or "tree is empty"
+        return None
+    if abs(incumbent) >= 1e50:  # CBC reports 1e+50 before the first incumbent
+        return None
+    return incumbent, bound
+
+
+class ProgressWriter(io.TextIOBase):
+    # Stands in for stdout during a solve and forwards parsed progress lines.
+
+    def __init__(self, key, events):
+        self.key = key
+        self.events = events
+        self.buffer = ''
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self.buffer += s
+        *lines, self.buffer = self.buffer.split('\n')
+        for line in lines:
+            progress = parse_progress(line)
+            if progress is not None:
+                incumbent, bound = progress
+                gap = abs(bound - incumbent) / max(abs(incumbent), 1e-10)
+                self.events.put((self.key, {'incumbent': incumbent, 'bound': bound, 'gap': gap}))
+        return len(s)
+
+
+def _init_worker(backend):
+    from pyomo.environ import SolverFactory
+
+    from . import extraction, lazy, model, solver  # noqa: F401  (imported to warm the worker)
+    SolverFactory(backend).available(exception_flag=False)
+
+
+def _worker_ready(barrier):
+    # holds every worker until all of them have run the initializer
+    barrier.wait()
+
+
+def _run_job(key, data, backend, lazy_capacity, events):
+    from .solver import solve_instance
+
+    events.put((key, {'state': 'running'}))
+    with contextlib.redirect_stdout(ProgressWriter(key, events)):
+        return solve_instance(data, backend, lazy_capacity=lazy_capacity, tee=True, verbose=False)
+
+
+class JobQueue:
+    """Jobs keyed by content hash, run on a pool of pre-warmed processes."""
+
+    def __init__(self, workers=2, backend='glpk', cache_dir=None):
+        self.workers = workers
+        self.backend = backend
+        self.cache = ResultCache(cache_dir) if cache_dir else None
+        self.jobs = {}
+        self.changed = threading.Condition()
+        self.manager = multiprocessing.Manager()
+        self.events = self.manager.Queue()
+        self.pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(backend,))
+        # the pool starts its processes on demand; make it start and warm all of them now
+        barrier = self.manager.Barrier(workers)
+        for future in [self.pool.submit(_worker_ready, barrier) for _ in range(workers)]:
+            future.result()
+        threading.Thread(target=self._pump_events, daemon=True).start()
+
+    def submit(self, data, backend=None, lazy_capacity=False):
+        """Queue an instance; return ``(job, deduplicated)``."""
+        validate(data)
+        backend = backend or self.backend
+        key = result_key(data, backend, lazy_capacity=lazy_capacity)
+        with self.changed:
+            job = self.jobs.get(key)
+            if job is not None and job['state'] != 'failed':
+                return job, True
+            cached = self._cached_job(key)
+            if cached is not None:
+                return cached, True
+            job = self.jobs[key] = {'id': key, 'state': 'queued', 'events': [{'state': 'queued'}]}
+        future = self.pool.submit(_run_job, key, data, backend, lazy_capacity, self.events)
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return job, False
+
+    def _finish(self, key, future):
+        try:
+            solution, error = future.result(), None
+        except Exception as e:
+            solution, error = None, f'{type(e).__name__}: {e}'
+        if solution is not None and self.cache and solution['status'] == 'optimal':
+            self.cache.put(key, solution)
+        with self.changed:
+            job = self.jobs[key]
+            if error is None:
+                job.update(state='done', solution=solution)
+                job['events'].append({'state': 'done', 'status': solution['status']})
+                if self.cache and solution['status'] == 'optimal':
+                    # the cache serves it from now on; open streams keep their reference
+                    del self.jobs[key]
+            else:
+                job.update(state='failed', error=error)
+                job['events'].append({'state': 'failed', 'error': error})
+            self.changed.notify_all()
+
+    def _cached_job(self, key):
+        solution = self.cache.get(key) if self.cache else None
+        if solution is None:
+            return None
+        return {'id': key, 'state': 'done', 'events': [{'state': 'done', 'status': solution['status']}],
+                'solution': solution}
+
+    def _pump_events(self):
+        while True:
+            try:
+                key, event = self.events.get()
+            except (EOFError, OSError):  # the manager was shut down
+                return
+            with self.changed:
+                job = self.jobs.get(key)
+                if job is None or job['state'] in FINAL_STATES:
+                    continue
+                if 'state' in event:
+                    job['state'] = event['state']
+                job['events'].append(event)
+                self.changed.notify_all()
+
+    def get(self, key):
+        """The job with id ``key``: a live job, or a finished one rebuilt from the cache."""
+        with self.changed:
+            job = self.jobs.get(key)
+        return job if job is not None else self._cached_job(key)
+
+    def stream(self, key):
+        """Yield the events of a job as they arrive, ending when it finishes."""
+        job = self.get(key)
+        sent = 0
+        while True:
+            with self.changed:
+                self.changed.wait_for(lambda: len(job['events']) > sent or job['state'] in FINAL_STATES)
+                new, finished = job['events'][sent:], job['state'] in FINAL_STATES
+            sent += len(new)
+            yield from new
+            if finished and not new:
+                return
+
+    def shutdown(self):
+        self.pool.shutdown(cancel_futures=True)
+        self.manager.shutdown()
+
+
+def job_summary(job):
+    summary = {'id': job['id'], 'state': job['state']}
+    if 'solution' in job:
+        summary['solution'] = to_json(job['solution'])
+    if 'error' in job:
+        summary['error'] = job['error']
+    return summary
+
+
+class Handler(BaseHTTPRequestHandler):
+    # self.server.jobs is the JobQueue
+
+    def send_json(self, code, obj):
+        body = json.dumps(obj).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            return self.send_json(404, {'error': 'not found'})
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            data = from_json(request['data'])
+            job, deduplicated = self.server.jobs.submit(
+                data, request.get('backend'), bool(request.get('lazy_capacity', False)))
+        except (ValueError, KeyError, TypeError) as e:
+            return self.send_json(400, {'error': str(e)})
+        self.send_json(200 if deduplicated else 202, dict(job_summary(job), deduplicated=deduplicated))
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        jobs = self.server.jobs
+        if parts == ['health']:
+            return self.send_json(200, {'workers': jobs.workers, 'jobs': len(jobs.jobs)})
+        if len(parts) < 2 or parts[0] != 'jobs' or jobs.get(parts[1]) is None:
+            return self.send_json(404, {'error': 'not found'})
+        if len(parts) == 2:
+            return self.send_json(200, job_summary(jobs.get(parts[1])))
+        if parts[2:] == ['events']:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.end_headers()
+            for event in jobs.stream(parts[1]):
+                self.wfile.write(json.dumps(event).encode('utf-8') + b'\n')
+                self.wfile.flush()
+            return
+        self.send_json(404, {'error': 'not found'})
+
+
+def serve(host='127.0.0.1', port=8765, workers=2, backend='glpk', cache_dir=None):
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.jobs = JobQueue(workers, backend, cache_dir)
+    print(f"Serving on http://{host}:{port} with {workers} workers ({backend})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.jobs.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='stochopt-service', description='Run the local solve service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--backend', default='glpk', help='default Pyomo solver name (default: %(default)s)')
+    parser.add_argument('--cache-dir', help='directory of cached results, shared with stochopt --cache-dir')
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.workers, args.backend, args.cache_dir)
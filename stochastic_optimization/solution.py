@@ -0,0 +1,80 @@
+"""Solution records shared by the CLI and the result cache.
+
+A solution is ``{'status': str, 'objective': float | None, 'variables':
+{var_name: {index: value}}}``.  Like instance data it is stored as JSON
+with indices written as rows ``[index..., value]``.  This module does not
+import Pyomo.
+"""
+import json
+import os
+
+from .data import content_hash, index_tuple
+
+# Solve options beyond backend and lazy_capacity that change the result, with
+# their defaults.  They enter the cache key only when set, so keys of runs
+# that do not use them stay the same as before the options existed.
+RESULT_OPTIONS = {
+    'scaling': None,
+    'eliminate_binaries': False,
+    'aggregate': False,
+    'scenario_tol': 0.0,
+    'scenario_tree': None,
+}
+
+
+def to_json(solution):
+    variables = {
+        name: [list(index_tuple(index)) + [v] for index, v in values.items()]
+        for name, values in solution['variables'].items()
+    }
+    return dict(solution, variables=variables)
+
+
+def from_json(obj):
+    variables = {
+        name: {tuple(row[:-1]): row[-1] for row in rows}
+        for name, rows in obj['variables'].items()
+    }
+    return dict(obj, variables=variables)
+
+
+def print_solution(solution):
+    # نمایش متغیرها
+    print("Variable values:")
+    for name, values in solution['variables'].items():
+        print(f"Variable {name}:")
+        for index, v in values.items():
+            print(f"{index}: {v}")
+
+
+def result_key(data, backend, lazy_capacity=False, **options):
+    """Cache key of a solve; shared by ``stochopt`` and the solve service."""
+    unknown = set(options) - set(RESULT_OPTIONS)
+    if unknown:
+        raise TypeError(f"unknown solve options {sorted(unknown)}")
+    return content_hash(data, backend=backend, lazy_capacity=lazy_capacity,
+                        **{k: v for k, v in options.items() if v != RESULT_OPTIONS[k]})
+
+
+class ResultCache:
+    """Directory of solved instances keyed by ``data.content_hash``."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        try:
+            with open(self.path(key), encoding='utf-8') as f:
+                return from_json(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, solution):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.path(key) + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(to_json(solution), f)
+        os.replace(tmp, self.path(key))
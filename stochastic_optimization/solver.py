@@ -0,0 +1,158 @@
+"""Solving the planning model and reporting the solver outcome."""
+from pyomo.environ import SolverFactory
+from pyomo.opt import TerminationCondition
+
+
+def solve(model, backend='glpk', tee=True, lazy_capacity=False, checkpoint=None, checkpoint_interval=None,
+          scaling=None, lazy_max_rounds=None, checkpoint_key=None, **solve_options):
+    """Solve ``model`` with the Pyomo solver plugin named ``backend``.
+
+    ``lazy_capacity`` must match the flag the model was built with; the
+    capacity families are then generated on demand by ``lazy.solve_lazy``,
+    for at most ``lazy_max_rounds`` rounds if given.
+    With ``checkpoint`` the run resumes from that file if it exists and
+    saves to it after every solve call.  ``checkpoint_interval`` also
+    splits a MIP solve into restarted segments of growing length for
+    warm-start capable solvers (see ``checkpoint.CheckpointingSolver``).
+    ``checkpoint_key`` identifies the instance; a checkpoint of another
+    instance is rejected, and one of a finished optimal run is restored
+    without solving again.
+    With ``scaling`` ('geometric' or 'equilibration') a scaled copy is
+    solved and its solution, and its duals if ``model`` has a ``dual``
+    suffix, are unscaled back onto ``model``.  Scaling cannot be combined
+    with the lazy capacity mode or checkpoints, which both work on
+    ``model`` itself.
+    Remaining keyword arguments are passed to ``solver.solve``.
+    """
+    if scaling is not None:
+        if lazy_capacity or checkpoint is not None:
+            raise ValueError("scaling cannot be combined with lazy_capacity or checkpoint")
+        from .scaling import scale_model, unscale_solution
+        scaled = scale_model(model, scaling)
+        result = SolverFactory(backend).solve(scaled, tee=tee, **solve_options)
+        unscale_solution(scaled, model)
+        return result
+    solver = SolverFactory(backend)
+    checkpointer = None
+    if checkpoint is not None:
+        from .checkpoint import CheckpointingSolver
+        solver = checkpointer = CheckpointingSolver(solver, backend, checkpoint, checkpoint_interval, checkpoint_key)
+        header = checkpointer.resume(model)
+        if header is not None and header.get('status') == 'optimal':
+            print(f"Checkpoint {checkpoint} holds a finished optimal run; not solving again.")
+            return checkpointer.stored_result(header)
+    if lazy_capacity:
+        from .lazy import solve_lazy
+        result = solve_lazy(model, solver, max_rounds=lazy_max_rounds, tee=tee, **solve_options)
+    else:
+        result = solver.solve(model, tee=tee, **solve_options)
+    if checkpointer is not None:
+        checkpointer.finish(model, result)
+    return result
+
+
+def build_instance(data, lazy_capacity=False, eliminate_binaries=False, aggregate=False, scenario_tol=0.0,
+                   scenario_tree=None):
+    """Build the model that ``solve_instance`` solves for these options.
+
+    Returns ``(instance, mapping, model, eliminated)``: the possibly
+    aggregated instance data, the scenario mapping of the aggregation (or
+    None), the model and whether the surplus/backlog binaries were
+    eliminated.  See ``solve_instance`` for the options.
+    """
+    from .model import build_model
+
+    if aggregate and scenario_tree not in (None, 'auto'):
+        raise ValueError("branching factors refer to the original scenarios; "
+                         "use scenario_tree='auto' together with aggregation")
+    instance, mapping = data, None
+    if aggregate:
+        from .aggregation import aggregate_scenarios
+        instance, mapping = aggregate_scenarios(data, scenario_tol)
+        print(f"Scenario aggregation: {len(data['sets']['sc'])} -> {len(instance['sets']['sc'])} scenarios")
+    tree = None
+    if scenario_tree is not None:
+        from .tree import ScenarioTree
+        tree = ScenarioTree.from_spec(instance, scenario_tree)
+        print(f"Scenario tree: {len(tree)} nodes for "
+              f"{len(instance['sets']['sc']) * len(instance['sets']['tp'])} scenario periods")
+    model = build_model(instance, lazy_capacity=lazy_capacity, tree=tree)
+    eliminated = False
+    if eliminate_binaries:
+        from .reformulation import eliminate_binaries as eliminate
+        eliminated = eliminate(model, instance)
+    return instance, mapping, model, eliminated
+
+
+def solve_instance(data, backend='glpk', lazy_capacity=False, tee=True, verbose=True, solution_store=None,
+                   eliminate_binaries=False, aggregate=False, scenario_tol=0.0, scenario_tree=None, **solve_options):
+    """Build, solve and extract one instance; return a solution record.
+
+    With ``verbose`` the outcome is printed by ``report`` (which also writes
+    the LP file of an infeasible model); otherwise nothing is printed or
+    written besides the solver log.  With ``solution_store`` (a directory)
+    the last optimal plan of the same network is used as a MIP start and
+    the new plan is stored in its place.  With ``eliminate_binaries`` the
+    surplus/backlog binaries are replaced by bounds when the data allows
+    it (see ``reformulation``).  With ``aggregate`` scenarios whose data
+    agree within ``scenario_tol`` are merged before the model is built and
+    the solution is reported for the original scenarios.  With
+    ``scenario_tree`` the recourse decisions are shared along a
+    multi-stage scenario tree: ``'auto'`` infers it from the data
+    histories, a sequence of branching factors per period builds it from
+    the scenario order (see ``tree.ScenarioTree``); branching factors
+    cannot be combined with ``aggregate``.
+    ``solve_options`` are passed to ``solve``.
+    """
+    from .extraction import extract, objective_value, scenario_positions
+
+    instance, mapping, model, eliminated = build_instance(
+        data, lazy_capacity=lazy_capacity, eliminate_binaries=eliminate_binaries, aggregate=aggregate,
+        scenario_tol=scenario_tol, scenario_tree=scenario_tree)
+    store = None
+    if solution_store is not None:
+        from .warmstart import SolutionStore, warm_start
+        store = SolutionStore(solution_store)
+        previous = store.load(data)
+        solver = SolverFactory(backend)
+        if previous is not None and solver.warm_start_capable():
+            warm_start(model, previous, solver, tee=tee)
+            solve_options['warmstart'] = True
+    if solve_options.get('checkpoint') is not None:
+        from .data import content_hash
+        solve_options.setdefault('checkpoint_key', content_hash(
+            instance, lazy_capacity=lazy_capacity, eliminate_binaries=eliminated, scenario_tree=scenario_tree))
+    result = solve(model, backend, tee=tee, lazy_capacity=lazy_capacity, **solve_options)
+    if eliminated:
+        from .reformulation import restore_exclusivity
+        restore_exclusivity(model)
+    if verbose:
+        status = report(model, result)
+    else:
+        status = str(result.solver.termination_condition)
+    solution = {'status': status, 'objective': objective_value(model), 'variables': extract(model)}
+    if mapping is not None:
+        from .aggregation import expand_solution
+        solution = expand_solution(solution, mapping, scenario_positions(model))
+    if store is not None and status == 'optimal':
+        store.save(data, solution)
+    return solution
+
+
+def report(model, result, infeasible_path='infeasible_model.lp'):
+    # بررسی وضعیت حل مدل
+    condition = result.solver.termination_condition
+    if condition == TerminationCondition.optimal:
+        print("Model solved optimally.")
+    elif condition == TerminationCondition.infeasible:
+        print("Model is infeasible. Extracting IIS...")
+        from .export import export_model
+        names = export_model(model, infeasible_path)  # ذخیره مدل در فرمت LP
+        print(f"Infeasible model saved as '{infeasible_path}' (row/column names in '{names}'). "
+              "Analyze it using glpsol:")
+        print(f"  glpsol --cpxlp {infeasible_path} --write iis.txt --output solution.txt")
+    elif condition == TerminationCondition.unbounded:
+        print("Model is unbounded. Check the objective function or bounds.")
+    else:
+        print(f"Model status: {condition}")
+    return str(condition)
@@ -0,0 +1,147 @@
+"""Multi-stage scenario trees over the time periods.
+
+A ``ScenarioTree`` assigns every (scenario, period) pair to a node.
+Scenarios that share a node in a period share a node in every earlier
+period too, so the nodes of a period refine those of the period before
+it.  With a tree, ``model.build_model`` declares the recourse variables
+once per node, so non-anticipativity holds by construction instead of
+through extra equality rows.  Rows and objective terms are built once
+per node, through the node's first scenario, and the per-scenario view
+of the variables covers only the ``view_keys`` those rows refer to, so
+the model grows with the number of nodes rather than of scenario paths.
+
+``from_data`` infers the tree from the instance: two scenarios share
+the node of period ``tp`` when their scenario-indexed data agree on
+every period up to ``tp``.  ``from_branching`` builds a tree from the
+number of children per period instead, over scenarios ordered as the
+leaves of that tree.  Like ``data`` this module does not import Pyomo.
+"""
+from math import prod
+
+from .data import PARAMS, model_entries
+
+
+def _period_entries(data):
+    """Return ``{(scenario, period): sorted scenario-free data rows}``.
+
+    Rows are normalized by ``data.model_entries``, so equal model data
+    gives equal rows.
+    """
+    entries = {(sc, tp): [] for sc in data['sets']['sc'] for tp in data['sets']['tp']}
+    for name, index_sets in PARAMS.items():
+        if 'sc' not in index_sets or 'tp' not in index_sets:
+            continue
+        sc_pos, tp_pos = index_sets.index('sc'), index_sets.index('tp')
+        for index, v in model_entries(data, name):
+            rows = entries.get((index[sc_pos], index[tp_pos]))
+            if rows is not None:
+                rows.append((name, tuple(x for i, x in enumerate(index) if i != sc_pos), v))
+    return {key: sorted(rows, key=repr) for key, rows in entries.items()}
+
+
+class ScenarioTree:
+
+    def __init__(self, scenarios, periods, node_of):
+        self.scenarios = list(scenarios)
+        self.periods = list(periods)
+        self.node_of = dict(node_of)
+        self.nodes = []
+        self.period_of = {}
+        self.parent = {}
+        self.members = {}
+        for tp_pos, tp in enumerate(self.periods):
+            for sc in self.scenarios:
+                node = self.node_of[sc, tp]
+                if node not in self.members:
+                    self.nodes.append(node)
+                    self.period_of[node] = tp
+                    self.members[node] = []
+                    self.parent[node] = self.node_of[sc, self.periods[tp_pos - 1]] if tp_pos else None
+                elif self.period_of[node] != tp or (
+                        tp_pos and self.parent[node] != self.node_of[sc, self.periods[tp_pos - 1]]):
+                    raise ValueError(f"node {node!r} of scenario {sc} in period {tp} is not a tree node")
+                self.members[node].append(sc)
+
+    @staticmethod
+    def _label(tp, sc):
+        return f'{tp}:{sc}'
+
+    @classmethod
+    def from_data(cls, data):
+        """Tree whose nodes are the distinct data histories of the scenarios."""
+        scenarios, periods = data['sets']['sc'], data['sets']['tp']
+        entries = _period_entries(data)
+        node_of = {}
+        parent = dict.fromkeys(scenarios)
+        for tp in periods:
+            nodes = {}
+            for sc in scenarios:
+                key = (parent[sc], repr(entries[sc, tp]))
+                node_of[sc, tp] = parent[sc] = nodes.setdefault(key, cls._label(tp, sc))
+        return cls(scenarios, periods, node_of)
+
+    @classmethod
+    def from_branching(cls, data, branching):
+        """Tree with ``branching[k]`` children per node in the k-th period.
+
+        The first entry is the number of nodes in the first period.  The
+        scenarios are the leaves in order, so their number must be the
+        product of the branching factors.  Raises ``ValueError`` if the
+        data of scenarios sharing a node differ.
+        """
+        scenarios, periods = data['sets']['sc'], data['sets']['tp']
+        branching = [int(b) for b in branching]
+        if len(branching) != len(periods) or any(b < 1 for b in branching):
+            raise ValueError(f"expected {len(periods)} positive branching factors, got {branching}")
+        if prod(branching) != len(scenarios):
+            raise ValueError(f"branching {branching} has {prod(branching)} leaves for {len(scenarios)} scenarios")
+        node_of = {}
+        for k, tp in enumerate(periods):
+            width = prod(branching[k + 1:])
+            for i, sc in enumerate(scenarios):
+                node_of[sc, tp] = cls._label(tp, scenarios[i - i % width])
+        tree = cls(scenarios, periods, node_of)
+        tree.check(data)
+        return tree
+
+    @classmethod
+    def from_spec(cls, data, spec):
+        """``'auto'`` for ``from_data``, else branching factors for ``from_branching``."""
+        return cls.from_data(data) if spec == 'auto' else cls.from_branching(data, spec)
+
+    def check(self, data):
+        """Raise ``ValueError`` listing the nodes whose scenarios carry different data."""
+        entries = _period_entries(data)
+        problems = [
+            f"scenarios {members[0]} and {sc} differ in period {self.period_of[node]} of node {node}"
+            for node, members in self.members.items()
+            for sc in members[1:]
+            if entries[sc, self.period_of[node]] != entries[members[0], self.period_of[node]]
+        ]
+        if problems:
+            raise ValueError("scenario tree does not match the data:\n  " + '\n  '.join(problems))
+
+    def node(self, sc, tp):
+        return self.node_of[sc, tp]
+
+    def representative(self, sc, tp):
+        """First scenario of the node of ``sc`` in ``tp``; its rows stand for the node."""
+        return self.members[self.node_of[sc, tp]][0]
+
+    def is_representative(self, sc, tp):
+        return self.representative(sc, tp) == sc
+
+    def view_keys(self):
+        """``(sc, tp)`` pairs the node rows use: each node's first scenario in
+        the node's period and, for the balance rules, the period before."""
+        position = {tp: k for k, tp in enumerate(self.periods)}
+        keys = {}
+        for node in self.nodes:
+            sc, k = self.members[node][0], position[self.period_of[node]]
+            if k:
+                keys[sc, self.periods[k - 1]] = None
+            keys[sc, self.periods[k]] = None
+        return list(keys)
+
+    def __len__(self):
+        return len(self.nodes)
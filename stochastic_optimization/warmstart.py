@@ -0,0 +1,104 @@
+"""Warm starts from previously solved plans of the same network.
+
+``SolutionStore`` keeps the latest optimal solution for each network
+topology: every set except the scenarios, plus the arcs that have
+transport capacity.  Day-to-day instances that differ only in demands
+and prices share a topology.  ``warm_start`` maps the stored values onto
+the variables of a freshly built model by name and index, then repairs
+them into a feasible incumbent.  It fixes the integer variables at their
+stored values and solves the remaining LP.
+"""
+import hashlib
+import json
+import os
+
+from pyomo.environ import Var
+from pyomo.opt import TerminationCondition
+
+from .data import index_tuple
+from .solution import from_json, to_json
+
+TOPOLOGY_SETS = ('m', 'p', 'tp', 'tr', 'b', 'c', 'oc', 'of', 'r', 'te', 'n', 'np')
+
+
+def topology_key(data):
+    arcs = sorted(
+        list(index[:3]) for index, capacity in data['params']['TCAU'].items() if capacity > 0)
+    topology = {'sets': {s: list(data['sets'][s]) for s in TOPOLOGY_SETS}, 'arcs': arcs}
+    payload = json.dumps(topology, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SolutionStore:
+    """Directory of solutions keyed by ``topology_key``."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, data):
+        return os.path.join(self.directory, topology_key(data) + '.json')
+
+    def load(self, data):
+        try:
+            with open(self.path(data), encoding='utf-8') as f:
+                return from_json(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, data, solution):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(data)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(to_json(solution), f)
+        os.replace(path + '.tmp', path)
+
+
+def apply_solution(model, solution):
+    """Copy stored values onto matching variables; return ``(matched, total)``."""
+    matched = total = 0
+    for var in model.component_objects(Var, active=True):
+        stored = solution['variables'].get(var.name, {})
+        for index in var:
+            total += 1
+            v = stored.get(index_tuple(index))
+            if v is not None:
+                var[index].set_value(v, skip_validation=True)
+                matched += 1
+    return matched, total
+
+
+def repair(model, solver, tee=False):
+    """Fix the integer variables and re-solve the LP to make the values feasible.
+
+    Returns False, leaving the stored values in place, when an integer
+    variable has no value or the fixed LP is not optimal.
+    """
+    integers = [v for var in model.component_objects(Var, active=True)
+                for v in var.values() if v.is_integer() and not v.fixed]
+    if any(v.value is None for v in integers):
+        return False
+    for v in integers:
+        v.fix(round(v.value))
+    try:
+        # an infeasible LP is an expected outcome, not an error
+        result = solver.solve(model, tee=tee, load_solutions=False)
+    finally:
+        for v in integers:
+            v.unfix()
+    if result.solver.termination_condition != TerminationCondition.optimal:
+        return False
+    model.solutions.load_from(result)
+    return True
+
+
+def warm_start(model, solution, solver, tee=False):
+    """Load ``solution`` into ``model`` as a MIP start; return True if it was repaired.
+
+    When repair fails the mapped values are still left on the model.
+    Solvers that accept partial starts can complete them.
+    """
+    matched, total = apply_solution(model, solution)
+    repaired = matched > 0 and repair(model, solver, tee)
+    print(f"Warm start: matched {matched} of {total} variables from the stored plan"
+          f"{', repaired to a feasible incumbent' if repaired else ''}.")
+    return repaired
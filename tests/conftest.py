@@ -0,0 +1,56 @@
+from itertools import product
+
+import pytest
+
+from stochastic_optimization.data import PARAMS, default_data, index_tuple
+
+
+@pytest.fixture(scope='session')
+def backend():
+    """Name of an available MIP solver plugin; skips the test if there is none."""
+    environ = pytest.importorskip('pyomo.environ')
+    name = next(
+        (name for name in ('appsi_highs', 'highs', 'glpk', 'cbc')
+         if environ.SolverFactory(name).available(exception_flag=False)),
+        None,
+    )
+    if name is None:
+        pytest.skip('no MIP solver available')
+    return name
+
+
+@pytest.fixture
+def bounded_data():
+    # the reference carbon coefficients are negative, which makes the tax a
+    # reward and the material transport unbounded
+    data = default_data()
+    data['params']['CCOEF'] = {tr: abs(v) for tr, v in data['params']['CCOEF'].items()}
+    return data
+
+
+@pytest.fixture
+def tree_data(bounded_data):
+    """Two periods and four scenarios whose demands branch as a (2, 2) tree."""
+    periods, scenarios = ['tp1', 'tp2'], ['S0', 'S1', 'S2', 'S3']
+    params = {}
+    for name, index_sets in PARAMS.items():
+        values = bounded_data['params'][name]
+        if not index_sets:
+            params[name] = values
+            continue
+        rows = {}
+        for index, v in values.items():
+            index = index_tuple(index)
+            if 'sc' in index_sets and index[index_sets.index('sc')] != 'SC1':
+                continue
+            choices = [scenarios if s == 'sc' else periods if s == 'tp' else [x]
+                       for x, s in zip(index, index_sets)]
+            for new in product(*choices):
+                growth = 1.0
+                if name in ('DEM', 'DEM_oc'):
+                    i = scenarios.index(new[index_sets.index('sc')])
+                    growth += 0.1 * (i // 2 if new[index_sets.index('tp')] == 'tp1' else i)
+                rows[new if len(new) > 1 else new[0]] = v * growth
+        params[name] = rows
+    params['PROB'] = dict.fromkeys(scenarios, 0.25)
+    return dict(bounded_data, sets=dict(bounded_data['sets'], sc=scenarios, tp=periods), params=params)
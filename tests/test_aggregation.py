@@ -0,0 +1,31 @@
+"""Scenario aggregation must merge equal data and report every scenario."""
+import pytest
+
+from stochastic_optimization.aggregation import aggregate_scenarios
+from stochastic_optimization.data import default_data
+
+
+def aggregated_count(data):
+    return len(aggregate_scenarios(data)[0]['sets']['sc'])
+
+
+def test_equal_model_data_merges():
+    data = default_data()
+    expected = aggregated_count(data)
+    # an explicit zero of a zero-default table is the same as no entry
+    data['params']['DEM'][('p1', 'c1', 'SC_oc1', 'tp1')] = 0
+    # and an integer value the same as the equal float
+    data['params']['DEM'] = {index: float(v) if index[2] == 'SC1' else v
+                             for index, v in data['params']['DEM'].items()}
+    assert aggregated_count(data) == expected < len(data['sets']['sc'])
+
+
+def test_solution_covers_original_scenarios(backend, bounded_data):
+    from stochastic_optimization.solver import solve_instance
+
+    plain = solve_instance(bounded_data, backend, tee=False, verbose=False)
+    merged = solve_instance(bounded_data, backend, tee=False, verbose=False, aggregate=True)
+    assert plain['status'] == merged['status'] == 'optimal'
+    assert merged['objective'] == pytest.approx(plain['objective'], rel=1e-6)
+    assert {name: set(values) for name, values in merged['variables'].items()} == \
+        {name: set(values) for name, values in plain['variables'].items()}
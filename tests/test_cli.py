@@ -0,0 +1,37 @@
+"""Conflicting or invalid options end in a message and exit code 2."""
+import pytest
+
+from stochastic_optimization.cli import parse_args, run
+
+
+@pytest.mark.parametrize('argv', [
+    ['--scaling', 'geometric', '--lazy-capacity'],
+    ['--scaling', 'equilibration', '--checkpoint', 'run.npz'],
+])
+def test_rejected_options(argv, capsys):
+    assert run(parse_args(argv)) == 2
+    assert 'cannot be combined' in capsys.readouterr().err
+
+
+def test_checkpoint_of_other_data(backend, bounded_data, tmp_path, capsys):
+    from stochastic_optimization.data import save_data
+
+    instance, checkpoint = str(tmp_path / 'instance.json'), str(tmp_path / 'run.npz')
+    save_data(bounded_data, instance)
+    assert run(parse_args([instance, '--backend', backend, '--quiet', '--checkpoint', checkpoint])) == 0
+    bounded_data['params']['TAXC'] += 1
+    save_data(bounded_data, instance)
+    capsys.readouterr()
+    assert run(parse_args([instance, '--backend', backend, '--quiet', '--checkpoint', checkpoint])) == 2
+    assert 'different instance data' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argv', [
+    ['--export', 'model.txt'],
+    ['--export', 'model.mps', '--lazy-capacity'],
+])
+def test_rejected_export(argv, capsys):
+    pytest.importorskip('numpy')
+    pytest.importorskip('pyomo.environ')
+    assert run(parse_args(argv)) == 2
+    assert 'export' in capsys.readouterr().err
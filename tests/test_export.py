@@ -0,0 +1,78 @@
+"""Exported models read back into HiGHS must give the solved objective."""
+import pytest
+
+highspy = pytest.importorskip('highspy')
+pytest.importorskip('numpy')
+pytest.importorskip('pyomo.environ')
+
+from stochastic_optimization.aggregation import aggregate_scenarios  # noqa: E402
+from stochastic_optimization.cli import parse_args, run  # noqa: E402
+from stochastic_optimization.data import save_data  # noqa: E402
+from stochastic_optimization.solver import solve_instance  # noqa: E402
+
+
+def highs_objective(path):
+    h = highspy.Highs()
+    h.setOptionValue('output_flag', False)
+    assert h.readModel(path) == highspy.HighsStatus.kOk
+    h.run()
+    assert h.getModelStatus() == highspy.HighsModelStatus.kOptimal
+    return h.getInfo().objective_function_value
+
+
+@pytest.mark.parametrize('suffix', ['mps', 'lp', 'lp.gz'])
+@pytest.mark.parametrize('flags', [[], ['--eliminate-binaries', '--aggregate-scenarios']])
+def test_export_matches_solve(backend, bounded_data, tmp_path, suffix, flags):
+    instance, path = str(tmp_path / 'instance.json'), str(tmp_path / f'model.{suffix}')
+    save_data(bounded_data, instance)
+    assert run(parse_args([instance, '--export', path] + flags)) == 0
+    solved = solve_instance(bounded_data, backend, tee=False, verbose=False,
+                            eliminate_binaries='--eliminate-binaries' in flags,
+                            aggregate='--aggregate-scenarios' in flags)
+    assert highs_objective(path) == pytest.approx(solved['objective'], rel=1e-6)
+
+
+def test_export_follows_solve_options(bounded_data, tmp_path):
+    instance, path = str(tmp_path / 'instance.json'), str(tmp_path / 'model.lp')
+    save_data(bounded_data, instance)
+    assert run(parse_args([instance, '--export', path, '--eliminate-binaries', '--aggregate-scenarios'])) == 0
+    with open(path + '.names', encoding='utf-8') as f:
+        names = [line.split('\t', 1)[1] for line in f]
+    assert not any(name.startswith(('iqsp', 'iqbp')) for name in names)
+    merged = [sc for sc, rep in aggregate_scenarios(bounded_data)[1].items() if sc != rep]
+    assert merged and not any(f',{sc},' in name for sc in merged for name in names)
+
+
+def read_names(path):
+    with open(path, encoding='utf-8') as f:
+        return dict(line.rstrip('\n').split('\t', 1) for line in f)
+
+
+@pytest.mark.parametrize('suffix', ['mps', 'lp'])
+def test_name_map_uses_pyomo_names(bounded_data, tmp_path, suffix):
+    from pyomo.environ import Constraint, Var
+
+    from stochastic_optimization.export import export_model
+    from stochastic_optimization.model import build_model
+
+    model = build_model(bounded_data)
+    names = read_names(export_model(model, str(tmp_path / f'model.{suffix}')))
+    rows = {name for label, name in names.items() if label.startswith('R')}
+    columns = {name for label, name in names.items() if label.startswith('C')}
+    assert rows == {con.name for con in model.component_data_objects(Constraint, active=True)}
+    assert columns <= {var.name for var in model.component_data_objects(Var)}
+
+
+def test_lp_name_map_lists_ranged_rows(tmp_path):
+    from pyomo.environ import ConcreteModel, Constraint, NonNegativeReals, Objective, Var
+
+    from stochastic_optimization.export import export_model
+
+    m = ConcreteModel()
+    m.x = Var(domain=NonNegativeReals)
+    m.Obj = Objective(expr=m.x + 5)
+    m.band = Constraint(expr=(1, m.x, 3))
+    path = str(tmp_path / 'model.lp')
+    assert read_names(export_model(m, path)) == {
+        'R0_lo': 'band', 'R0_hi': 'band', 'C0': 'ONE_VAR_CONSTANT', 'C1': 'x'}
+    assert highs_objective(path) == pytest.approx(6)
@@ -0,0 +1,26 @@
+"""Dropping the surplus/backlog binaries must not change the optimum."""
+import pytest
+
+from stochastic_optimization.reformulation import EXCLUSIVE_PAIRS, binary_elimination_blockers
+
+
+def test_negative_probability_blocks_elimination(bounded_data):
+    assert binary_elimination_blockers(bounded_data) == []
+    bounded_data['params']['PROB']['SC1'] = -1
+    assert binary_elimination_blockers(bounded_data) == ['PROB[SC1] = -1 is negative']
+
+
+def test_elimination_matches_milp(backend, bounded_data):
+    from stochastic_optimization.solver import solve_instance
+
+    milp = solve_instance(bounded_data, backend, tee=False, verbose=False)
+    lp = solve_instance(bounded_data, backend, tee=False, verbose=False, eliminate_binaries=True)
+    assert milp['status'] == lp['status'] == 'optimal'
+    assert lp['objective'] == pytest.approx(milp['objective'], rel=1e-6)
+    variables = lp['variables']
+    for surplus, backlog, surplus_bin, backlog_bin, *_ in EXCLUSIVE_PAIRS:
+        for index, s in variables[surplus].items():
+            b = variables[backlog][index]
+            assert min(s, b) == pytest.approx(0, abs=1e-9)
+            assert variables[surplus_bin][index] == (1 if s > 0 else 0)
+            assert variables[backlog_bin][index] == (1 if b > 0 else 0)
@@ -0,0 +1,44 @@
+"""Scaled solves must reach the optimum of the unscaled model."""
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('pyomo.environ')
+
+from stochastic_optimization.scaling import METHODS  # noqa: E402
+from stochastic_optimization.solver import solve_instance  # noqa: E402
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_scaled_objective_matches_unscaled(backend, bounded_data, method):
+    unscaled = solve_instance(bounded_data, backend, tee=False, verbose=False)
+    scaled = solve_instance(bounded_data, backend, tee=False, verbose=False, scaling=method)
+    assert unscaled['status'] == scaled['status'] == 'optimal'
+    assert scaled['objective'] == pytest.approx(unscaled['objective'], rel=1e-6)
+
+
+def small_lp():
+    from pyomo.environ import ConcreteModel, Constraint, NonNegativeReals, Objective, Suffix, Var
+
+    m = ConcreteModel()
+    m.x = Var(domain=NonNegativeReals)
+    m.y = Var(domain=NonNegativeReals)
+    m.Obj = Objective(expr=3 * m.x + 4e-3 * m.y)
+    m.first = Constraint(expr=1000 * m.x + 2 * m.y >= 4000)
+    m.second = Constraint(expr=3 * m.x + 1e-3 * m.y >= 6)
+    m.dropped = Constraint(expr=m.x >= 100)
+    m.dropped.deactivate()
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    return m
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_scaled_duals_match_unscaled(backend, method):
+    from stochastic_optimization.solver import solve
+
+    unscaled, scaled = small_lp(), small_lp()
+    solve(unscaled, backend, tee=False)
+    solve(scaled, backend, tee=False, scaling=method)
+    assert any(factor != 1.0 for factor in scaled.scaling_factor.values())
+    for row in (scaled.first, scaled.second):
+        assert scaled.dual[row] == pytest.approx(unscaled.dual[unscaled.component(row.name)], rel=1e-6)
+    assert scaled.dropped not in scaled.dual
@@ -0,0 +1,31 @@
+"""Progress parsing and job bookkeeping of the solve service."""
+import pytest
+
+from stochastic_optimization.service import JobQueue, parse_progress
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('+   145: >>>>>   2.508200000e+06 >=   2.400000000e+06   4.3% (12; 0)', (2508200.0, 2400000.0)),
+    ('+   290: mip =   2.508200000e+06 >=   2.450000000e+06   2.3% (20; 3)', (2508200.0, 2450000.0)),
+    ('+     0: mip =     not found yet >=              -inf        (1; 0)', None),
+    ('+   310: mip =   2.508200000e+06 >=     tree is empty   0.0% (0; 23)', None),
+    ('Cbc0010I After 100 nodes, 5 on tree, 2508200 best solution, best possible 2400000 (0.52 seconds)',
+     (2508200.0, 2400000.0)),
+])
+def test_parse_progress(line, expected):
+    assert parse_progress(line) == expected
+
+
+def test_finished_job_is_served_from_cache(backend, bounded_data, tmp_path):
+    queue = JobQueue(workers=2, backend=backend, cache_dir=str(tmp_path))
+    try:
+        assert len(queue.pool._processes) == 2
+        job, deduplicated = queue.submit(bounded_data)
+        assert not deduplicated
+        events = list(queue.stream(job['id']))
+        assert events[-1] == {'state': 'done', 'status': 'optimal'}
+        assert job['id'] not in queue.jobs
+        assert queue.get(job['id'])['solution']['objective'] == pytest.approx(job['solution']['objective'])
+        assert queue.submit(bounded_data)[1]
+    finally:
+        queue.shutdown()
@@ -0,0 +1,29 @@
+"""Scenario trees must follow the model data and report every scenario."""
+import pytest
+
+from stochastic_optimization.data import validate
+from stochastic_optimization.tree import ScenarioTree
+
+
+def test_equal_model_data_shares_nodes(tree_data):
+    validate(tree_data)
+    dem = tree_data['params']['DEM']
+    # S0 and S1 share the first-period node: an explicit zero equals no entry
+    dem[('p1', 'c1', 'S0', 'tp1')] = 0
+    del dem[('p1', 'c1', 'S1', 'tp1')]
+    # S2 and S3 share it too: an integer equals the same float
+    dem[('p1', 'c1', 'S2', 'tp1')] = 30
+    dem[('p1', 'c1', 'S3', 'tp1')] = 30.0
+    assert len(ScenarioTree.from_data(tree_data)) == 6
+    assert len(ScenarioTree.from_branching(tree_data, [2, 2])) == 6
+
+
+def test_solution_covers_original_scenarios(backend, tree_data):
+    from stochastic_optimization.solver import solve_instance
+
+    plain = solve_instance(tree_data, backend, tee=False, verbose=False)
+    shared = solve_instance(tree_data, backend, tee=False, verbose=False, scenario_tree='auto')
+    assert plain['status'] == shared['status'] == 'optimal'
+    assert shared['objective'] == pytest.approx(plain['objective'], rel=1e-6)
+    assert {name: set(values) for name, values in shared['variables'].items()} == \
+        {name: set(values) for name, values in plain['variables'].items()}
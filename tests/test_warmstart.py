@@ -0,0 +1,23 @@
+"""Warm starts from the solution store must never change the outcome."""
+import pytest
+
+pytest.importorskip('pyomo.environ')
+
+from stochastic_optimization.solver import solve_instance  # noqa: E402
+
+
+def scale_overseas_demand(data, factor):
+    data['params']['DEM_oc'] = {index: v * factor for index, v in data['params']['DEM_oc'].items()}
+    return data
+
+
+@pytest.mark.parametrize('factor', [5, 20])
+def test_stored_plan_for_new_demand(backend, bounded_data, tmp_path, factor):
+    # at 20x the stored plan's backlog binaries make the fixed-integer repair infeasible
+    first = solve_instance(bounded_data, backend, tee=False, verbose=False, solution_store=str(tmp_path))
+    assert first['status'] == 'optimal'
+    data = scale_overseas_demand(bounded_data, factor)
+    cold = solve_instance(data, backend, tee=False, verbose=False)
+    warm = solve_instance(data, backend, tee=False, verbose=False, solution_store=str(tmp_path))
+    assert cold['status'] == warm['status'] == 'optimal'
+    assert warm['objective'] == pytest.approx(cold['objective'], rel=1e-6)